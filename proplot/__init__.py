@@ -4,10 +4,14 @@ A python package for making beautiful, publication-quality graphics.
 """
 # For now import everything into the top-level module namespace
 # In the future we will not import the class names
-import pkg_resources as _pkg
+# NOTE: Rarely used modules are imported when their objects are first
+# requested from the top-level namespace (see PEP 562). The crs module is
+# always imported because constructor.py and axes/geo.py require it.
+import importlib as _importlib
+import sys as _sys
 
 from .config import *  # noqa: F401 F403
-from .internals import timers
+from .internals import _get_version, timers
 
 with timers._benchmark('imports'):
     from .utils import *  # noqa: F401 F403
@@ -20,11 +24,42 @@ with timers._benchmark('imports'):
     from .axes import *  # noqa: F401 F403
     from .figure import *  # noqa: F401 F403
     from .ui import *  # noqa: F401 F403
-    from .demos import *  # noqa: F401 F403
+
+# Modules whose objects are imported on first access
+_lazy_modules = ('demos',)
+
+
+def _import_lazy(name):
+    """
+    Import the lazily loaded module.
+    """
+    return _importlib.import_module('.' + name, __name__)
+
+
+def __getattr__(name):
+    """
+    Import the module that defines the requested object.
+    """
+    if name[:1] != '_':  # skip special attributes requested by tools
+        for module in map(_import_lazy, _lazy_modules):
+            if name in module.__all__:
+                obj = globals()[name] = getattr(module, name)
+                return obj
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    names = set(globals())
+    for module in map(_import_lazy, _lazy_modules):
+        names.update(module.__all__)
+    return sorted(names)
+
+
+if _sys.version_info < (3, 7):  # module __getattr__ is unsupported
+    for _module in map(_import_lazy, _lazy_modules):
+        for _name in _module.__all__:
+            globals()[_name] = getattr(_module, _name)
 
 # SCM versioning
 name = 'proplot'
-try:
-    version = __version__ = _pkg.get_distribution(__name__).version
-except _pkg.DistributionNotFound:
-    version = __version__ = 'unknown'
+version = __version__ = _get_version(__name__)
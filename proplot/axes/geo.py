@@ -40,10 +40,6 @@ try:
 except ModuleNotFoundError:
     cfeature = cticker = ccrs = None
     GeoAxesBase = object
-try:
-    import mpl_toolkits.basemap as mbasemap
-except ModuleNotFoundError:
-    mbasemap = None
 
 __all__ = ['GeoAxes', 'BasemapAxes', 'CartopyAxes']
 
@@ -1252,7 +1248,8 @@ class BasemapAxes(GeoAxes):
         # WARNING: Investigated whether Basemap.__init__() could be called
         # twice with updated proj kwargs to modify map bounds after creation
         # and python immmediately crashes. Do not try again.
-        import mpl_toolkits.basemap  # noqa: F401 verify available
+        # NOTE: Basemap is slow to import so we import it here.
+        import mpl_toolkits.basemap as mbasemap  # verify available
         if not isinstance(map_projection, mbasemap.Basemap):
             raise ValueError(
                 'BasemapAxes requires map_projection=basemap.Basemap'
@@ -1494,6 +1491,7 @@ class BasemapAxes(GeoAxes):
 
     @projection.setter
     def projection(self, map_projection):
+        import mpl_toolkits.basemap as mbasemap
         if not isinstance(map_projection, mbasemap.Basemap):
             raise ValueError('Projection must be a basemap.Basemap instance.')
         self._map_projection = map_projection
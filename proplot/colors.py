@@ -9,6 +9,8 @@ New colormap classes and colormap normalization classes.
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from numbers import Integral, Number
 from xml.etree import ElementTree
 
@@ -20,7 +22,7 @@ from matplotlib import rcParams
 
 from .internals import ic  # noqa: F401
 from .internals import _not_none, docstring, warnings
-from .utils import to_rgb, to_rgba, to_xyz, to_xyza
+from .utils import _to_rgb_array, to_rgb, to_rgba, to_xyz, to_xyza
 
 if hasattr(mcm, '_cmap_registry'):
     _cmap_database_attr = '_cmap_registry'
@@ -60,6 +62,10 @@ CMAPS_DIVERGING = tuple(
         ('DryWet', 'WetDry')
     )
 )
+CMAPS_MIRRORS = {
+    key1: key2 for pair in CMAPS_DIVERGING
+    for key1, key2 in (pair, pair[::-1])
+}
 
 
 docstring.snippets['cmap.init'] = """
@@ -228,10 +234,7 @@ def _make_segmentdata_array(values, coords=None, ratios=None):
         coords = np.linspace(0, 1, len(values))
 
     # Build segmentdata array
-    array = []
-    for c, value in zip(coords, values):
-        array.append((c, value, value))
-    return array
+    return list(zip(coords, values, values))
 
 
 def make_mapping_array(N, data, gamma=1.0, inverse=False):
@@ -284,93 +287,200 @@ def make_mapping_array(N, data, gamma=1.0, inverse=False):
         saturation, thereby emphasizing "extreme" data values with stronger
         colors.
     """
-    # Allow for *callable* instead of linearly interpolating between segments
-    gammas = np.atleast_1d(gamma)
-    if (gammas < 0.01).any() or (gammas > 10).any():
-        raise ValueError('Gamma can only be in range [0.01,10].')
-    if callable(data):
-        if len(gammas) > 1:
+    return _make_mapping_arrays(N, (data,), (gamma,), (inverse,))[0]
+
+
+def _make_mapping_arrays(N, datas, gammas, inverses):
+    """
+    Return a ``(channels, N)`` array of lookup tables for several segment data
+    channels at once. See `make_mapping_array` for details.
+    """
+    # Parse each channel
+    # NOTE: Coordinates for successive channels are offset by N so that levels
+    # for every channel can be located with a single searchsorted call.
+    luts = np.empty((len(datas), N), float)
+    channels, xs, xoffsets, y0s, y1s, gs, rs = [], [], [], [], [], [], []
+    for i, (data, gamma, inverse) in enumerate(zip(datas, gammas, inverses)):
+        # Allow for *callable* instead of linearly interpolating between segments
+        igammas = np.atleast_1d(gamma)
+        if (igammas < 0.01).any() or (igammas > 10).any():
+            raise ValueError('Gamma can only be in range [0.01,10].')
+        if callable(data):
+            if len(igammas) > 1:
+                raise ValueError(
+                    'Only one gamma allowed for functional segmentdata.')
+            x = np.linspace(0, 1, N)**gamma
+            luts[i] = np.array(data(x), dtype=float)
+            continue
+
+        # Get array
+        data = np.array(data)
+        shape = data.shape
+        if len(shape) != 2 or shape[1] != 3:
+            raise ValueError('Data must be nx3 format.')
+        if len(igammas) != 1 and len(igammas) != shape[0] - 1:
             raise ValueError(
-                'Only one gamma allowed for functional segmentdata.')
-        x = np.linspace(0, 1, N)**gamma
-        lut = np.array(data(x), dtype=float)
-        return lut
-
-    # Get array
-    data = np.array(data)
-    shape = data.shape
-    if len(shape) != 2 or shape[1] != 3:
-        raise ValueError('Data must be nx3 format.')
-    if len(gammas) != 1 and len(gammas) != shape[0] - 1:
-        raise ValueError(
-            f'Need {shape[0]-1} gammas for {shape[0]}-level mapping array, '
-            f'but got {len(gamma)}.'
-        )
-    if len(gammas) == 1:
-        gammas = np.repeat(gammas, shape[:1])
-
-    # Get indices
-    x = data[:, 0]
-    y0 = data[:, 1]
-    y1 = data[:, 2]
-    if x[0] != 0.0 or x[-1] != 1.0:
-        raise ValueError(
-            'Data mapping points must start with x=0 and end with x=1.'
-        )
-    if (np.diff(x) < 0).any():
-        raise ValueError(
-            'Data mapping points must have x in increasing order.'
-        )
-    x = x * (N - 1)
+                f'Need {shape[0]-1} gammas for {shape[0]}-level mapping array, '
+                f'but got {len(gamma)}.'
+            )
+        if len(igammas) == 1:
+            igammas = np.repeat(igammas, shape[:1])
+        else:  # pad so that gammas can be indexed by row
+            igammas = np.append(igammas, 1.0)
+
+        # Get coordinates
+        x = data[:, 0]
+        if x[0] != 0.0 or x[-1] != 1.0:
+            raise ValueError(
+                'Data mapping points must start with x=0 and end with x=1.'
+            )
+        if (np.diff(x) < 0).any():
+            raise ValueError(
+                'Data mapping points must have x in increasing order.'
+            )
+        x = x * (N - 1)
+        channels.append(i)
+        xs.append(x)
+        xoffsets.append(x + i * N)
+        y0s.append(data[:, 1])
+        y1s.append(data[:, 2])
+        gs.append(igammas)
+        rs.append(np.full(shape[:1], bool(inverse)))
+    if not channels:
+        return luts
 
     # Get distances from the segmentdata entry to the *left* for each requested
     # level, excluding ends at (0,1), which must exactly match segmentdata ends
+    channels = np.array(channels)
+    x, y0, y1 = np.concatenate(xs), np.concatenate(y0s), np.concatenate(y1s)
+    gammas, inverses = np.concatenate(gs), np.concatenate(rs)
     xq = (N - 1) * np.linspace(0, 1, N)
+    xq = np.tile(xq[1:-1], len(channels))
+    offsets = np.repeat(channels * N, max(N - 2, 0))
     # where xq[i] must be inserted so it is larger than x[ind[i]-1] but
     # smaller than x[ind[i]]
-    ind = np.searchsorted(x, xq)[1:-1]
-    distance = (xq[1:-1] - x[ind - 1]) / (x[ind] - x[ind - 1])
+    ind = np.searchsorted(np.concatenate(xoffsets), xq + offsets)
+    distance = (xq - x[ind - 1]) / (x[ind] - x[ind - 1])
 
     # Scale distances in each segment by input gamma
-    # The ui are starting-points, the ci are counts from that point
-    # over which segment applies (i.e. where to apply the gamma), the relevant
-    # 'segment' is to the *left* of index returned by searchsorted
-    _, uind, cind = np.unique(ind, return_index=True, return_counts=True)
-    for ui, ci in zip(uind, cind):  # length should be N-1
-        # the relevant segment is to *left* of this number
-        gamma = gammas[ind[ui] - 1]
-        if gamma == 1:
-            continue
-        ireverse = False
-        if ci > 1:  # i.e. more than 1 color in this 'segment'
-            # by default want to weight toward a *lower* channel value
-            ireverse = ((y0[ind[ui]] - y1[ind[ui] - 1]) < 0)
-        if inverse:
-            ireverse = not ireverse
-        if ireverse:
-            distance[ui:ui + ci] = 1 - (1 - distance[ui:ui + ci])**gamma
-        else:
-            distance[ui:ui + ci] **= gamma
+    # The relevant 'segment' is to the *left* of index returned by searchsorted.
+    # By default want to weight toward a *lower* channel value, but only if
+    # more than 1 color is in this 'segment'.
+    _, segments, counts = np.unique(ind, return_inverse=True, return_counts=True)
+    gamma = gammas[ind - 1]
+    reverse = (counts[segments] > 1) & ((y0[ind] - y1[ind - 1]) < 0)
+    reverse ^= inverses[ind - 1]
+    distance = np.where(
+        gamma == 1, distance, np.where(
+            reverse, 1 - (1 - distance) ** gamma, distance ** gamma
+        )
+    )
 
     # Perform successive linear interpolations all rolled up into one equation
-    lut = np.zeros((N,), float)
-    lut[1:-1] = distance * (y0[ind] - y1[ind - 1]) + y1[ind - 1]
-    lut[0] = y1[0]
-    lut[-1] = y0[-1]
-    return lut
+    lut = distance * (y0[ind] - y1[ind - 1]) + y1[ind - 1]
+    sizes = [len(x) for x in xs]
+    ends = np.cumsum(sizes)
+    luts[channels, 1:-1] = lut.reshape((len(channels), max(N - 2, 0)))
+    luts[channels, 0] = y1[ends - sizes]
+    luts[channels, -1] = y0[ends - 1]
+    return luts
 
 
 class _Colormap(object):
     """
     Mixin class used to add some helper methods.
     """
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lut_source', None)  # do not pickle the source colormap
+        return state
+
+    def __setstate__(self, state):
+        # Support colormaps pickled before 'N' was a property
+        state = state.copy()
+        if 'N' in state:
+            state['_N'] = state.pop('N')
+        self.__dict__.update(state)
+
+    @property
+    def N(self):
+        """
+        The number of colors in the lookup table. Changing this discards the
+        existing lookup table.
+        """
+        return self._N
+
+    @N.setter
+    def N(self, N):
+        N = int(N)
+        if N == getattr(self, '_N', None):
+            return
+        self._N = N
+        self._i_under, self._i_over, self._i_bad = N, N + 1, N + 2
+        self._reset_lut()
+
+    def _reset_lut(self):
+        """
+        Discard the lookup table so that it is rebuilt when it is next needed.
+        """
+        self._isinit = False
+        self._lut_source = None
+        self.__dict__.pop('_lut', None)
+        self.__dict__.pop('_lut_hsl', None)
+
+    def _link_lut(self, source):
+        """
+        Share the lookup table of the source colormap when the lookup table is
+        first needed, unless either colormap has been modified in the meantime.
+        """
+        # NOTE: The colormaps must have the same segment data or colors.
+        # Callers are responsible for checking this.
+        get_state = _ColormapCache._get_state
+        state, state_source = get_state(self), get_state(source)
+        if (
+            type(self) is type(source)
+            and state[:-1] == state_source[:-1]  # exclude the data id
+            and getattr(self, '_clip', None) == getattr(source, '_clip', None)
+        ):
+            self._lut_source = (source, state_source, state)
+
+    def _share_lut(self):
+        """
+        Use the lookup table from `_link_lut` if possible. Return whether
+        the lookup table is now initialized.
+        """
+        link = getattr(self, '_lut_source', None)
+        self._lut_source = None  # release the source colormap
+        if link is None:
+            return False
+        source, state_source, state = link
+        get_state = _ColormapCache._get_state
+        if get_state(source) != state_source or get_state(self) != state:
+            return False
+        if not source._isinit:
+            source._init()
+        self._lut = source._lut
+        self._isinit = True
+        self._lut_shared = source._lut_shared = True
+        return True
+
+    def _unshare_lut(self):
+        """
+        Copy the lookup table before it is modified in-place if it is shared
+        with another colormap.
+        """
+        if getattr(self, '_lut_shared', False):
+            self._lut = self._lut.copy()
+            self._lut_shared = False
+
     def _get_data(self, ext, alpha=True):
         """
-        Return a string containing the colormap colors for saving.
+        Return a string containing the colormap colors for saving. For
+        ``.npy`` files, return an array with x-coordinate and channel columns.
 
         Parameters
         ----------
-        ext : {'hex', 'txt', 'rgb'}
+        ext : {'hex', 'txt', 'rgb', 'npy'}
             The filename extension.
         alpha : bool, optional
             Whether to include an opacity column.
@@ -380,8 +490,11 @@ class _Colormap(object):
             self._init()
         colors = self._lut[:-3, :]
 
-        # Get data string
-        if ext == 'hex':
+        # Get data string or array
+        if ext == 'npy':
+            x = np.linspace(0, 1, colors.shape[0])
+            data = np.column_stack((x, colors if alpha else colors[:, :3]))
+        elif ext == 'hex':
             data = ', '.join(mcolors.to_hex(color) for color in colors)
         elif ext in ('txt', 'rgb'):
             rgb = mcolors.to_rgba if alpha else mcolors.to_rgb
@@ -392,7 +505,7 @@ class _Colormap(object):
         else:
             raise ValueError(
                 f'Invalid extension {ext!r}. Options are: '
-                "'hex', 'txt', 'rgb', 'rgba'."
+                "'hex', 'txt', 'rgb', 'npy'."
             )
         return data
 
@@ -467,23 +580,25 @@ class _Colormap(object):
         # Read .rgb and .rgba files
         if ext in ('txt', 'rgb'):
             # Load
-            # NOTE: This appears to be biggest import time bottleneck! Increases
-            # time from 0.05s to 0.2s, with numpy loadtxt or with this regex thing.
-            delim = re.compile(r'[,\s]+')
-            data = [
-                delim.split(line.strip())
-                for line in open(filename)
-                if line.strip() and line.strip()[0] != '#'
-            ]
+            # NOTE: This used to be the biggest import time bottleneck. Now read
+            # the entire table with a single numpy call instead of converting
+            # each number separately.
+            with open(filename) as fh:
+                lines = [line.strip() for line in fh]
+            lines = [line for line in lines if line and line[0] != '#']
+            rows = [line.replace(',', ' ').split() for line in lines]
+            ncols = {len(row) for row in rows}
             try:
-                data = [[float(num) for num in line] for line in data]
+                if len(ncols) != 1:
+                    raise ValueError('Inconsistent number of columns.')
+                data = [num for row in rows for num in row]
+                data = np.array(data, dtype=float).reshape(len(rows), ncols.pop())
             except ValueError:
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Expected a table of comma '
                     'or space-separated values.'
                 )
             # Build x-coordinates and standardize shape
-            data = np.array(data)
             if data.shape[1] not in (3, 4):
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Got {data.shape[1]} columns, '
@@ -497,6 +612,8 @@ class _Colormap(object):
         # Load XML files created with scivizcolor
         # Adapted from script found here:
         # https://sciviscolor.org/matlab-matplotlib-pv44/
+        # NOTE: Read each <Point> attribute across the parsed tree at once
+        # rather than building the color list point by point.
         elif ext == 'xml':
             try:
                 doc = ElementTree.parse(filename)
@@ -505,31 +622,44 @@ class _Colormap(object):
                     f'Failed to load {filename!r}. Parsing error.',
                     ElementTree.ParseError
                 )
-            x, data = [], []
-            for s in doc.getroot().findall('.//Point'):
-                # Verify keys
-                if any(key not in s.attrib for key in 'xrgb'):
-                    return _warn_or_raise(
-                        f'Failed to load {filename!r}. Missing an x, r, g, or b '
-                        'specification inside one or more <Point> tags.'
-                    )
-                # Get data
-                color = []
-                for key in 'rgbao':  # o for opacity
-                    if key not in s.attrib:
-                        continue
-                    color.append(float(s.attrib[key]))
-                x.append(float(s.attrib['x']))
-                data.append(color)
-            # Convert to array
-            if not all(
-                len(data[0]) == len(color) and len(color) in (3, 4)
-                for color in data
-            ):
+            points = [s.attrib for s in doc.getroot().iter('Point')]
+            if any(key not in attrib for attrib in points for key in 'xrgb'):
+                return _warn_or_raise(
+                    f'Failed to load {filename!r}. Missing an x, r, g, or b '
+                    'specification inside one or more <Point> tags.'
+                )
+            channels = {
+                tuple(key for key in 'rgbao' if key in attrib)  # o for opacity
+                for attrib in points
+            }
+            if len(channels) != 1 or len(next(iter(channels))) not in (3, 4):
                 return _warn_or_raise(
                     f'Failed to load {filename!r}. Unexpected number of channels '
                     'or mixed channels across <Point> tags.'
                 )
+            try:
+                keys = ('x', *channels.pop())
+                data = [[attrib[key] for key in keys] for attrib in points]
+                data = np.array(data, dtype=float)
+            except ValueError:
+                return _warn_or_raise(
+                    f'Failed to load {filename!r}. Invalid <Point> values.'
+                )
+            x, data = data[:, 0], data[:, 1:]
+
+        # Read binary files with x-coordinate and channel columns
+        # NOTE: These can be saved alongside text files for faster loading
+        elif ext == 'npy':
+            try:
+                data = np.load(filename)
+            except (OSError, ValueError):
+                return _warn_or_raise(f'Failed to load {filename!r}.')
+            if data.ndim != 2 or data.shape[1] not in (4, 5):
+                return _warn_or_raise(
+                    f'Failed to load {filename!r}. Expected an array with 4 or 5 '
+                    'columns for the x, red, green, blue, and opacity channels.'
+                )
+            x, data = data[:, 0], data[:, 1:]
 
         # Read hex strings
         elif ext == 'hex':
@@ -562,7 +692,7 @@ class _Colormap(object):
             data = data[::-1, :]
             x = 1 - x[::-1]
         if listed:
-            return ListedColormap(data, name)
+            return ListedColormap(data.tolist(), name)  # same type for all formats
         else:
             data = [(x, color) for x, color in zip(x, data)]
             return LinearSegmentedColormap.from_list(name, data)
@@ -608,6 +738,15 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         if alpha is not None:
             self.set_alpha(alpha)
 
+    def _init(self):
+        # Use the lookup table shared by the colormap this was copied from
+        if not self._share_lut():
+            super()._init()
+
+    def _set_extremes(self, *args, **kwargs):
+        self._unshare_lut()
+        super()._set_extremes(*args, **kwargs)
+
     def append(self, *args, ratios=None, name=None, N=None, **kwargs):
         """
         Return the concatenation of this colormap with the
@@ -869,11 +1008,12 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             ``.json`` (default)  JSON database of the channel segment data.
             ``.hex``             Comma-delimited list of HEX strings.
             ``.rgb``, ``.txt``   3-4 column table of channel values.
+            ``.npy``             Binary table of coordinates and channel values.
             ===================  ==========================================
 
         alpha : bool, optional
-            Whether to include an opacity column for ``.rgb``
-            and ``.txt`` files.
+            Whether to include an opacity column for ``.rgb``,
+            ``.txt``, and ``.npy`` files.
         """
         dirname = os.path.join('~', '.proplot', 'cmaps')
         filename = self._parse_path(path, dirname, 'json')
@@ -908,6 +1048,8 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
                 json.dump(data, fh, indent=4)
 
         # Save lookup table colors
+        elif ext[1:] == 'npy':
+            np.save(filename, self._get_data('npy', alpha=alpha))
         else:
             data = self._get_data(ext[1:], alpha=alpha)
             with open(filename, 'w') as fh:
@@ -934,8 +1076,9 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             100 percent to 0 percent opacity in the right *third* of the colormap.
         """
         alpha = _make_segmentdata_array(alpha, coords=coords, ratios=ratios)
-        self._segmentdata['alpha'] = alpha
-        self._isinit = False
+        self._segmentdata = {**self._segmentdata, 'alpha': alpha}
+        self._reset_lut()
+        _cmap_cache.discard(self)
 
     def set_cyclic(self, b):
         """
@@ -943,7 +1086,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         for details.
         """
         self._cyclic = bool(b)
-        self._isinit = False
+        self._reset_lut()
 
     def shifted(self, shift=180, name=None, **kwargs):
         """
@@ -1091,14 +1234,15 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         """
         if name is None:
             name = self.name + '_copy'
-        if segmentdata is None:
-            segmentdata = self._segmentdata.copy()
         if gamma is None:
             gamma = self._gamma
         if cyclic is None:
             cyclic = self._cyclic
         if N is None:
             N = self.N
+        share = segmentdata is None and alpha is None
+        if segmentdata is None:
+            segmentdata = self._segmentdata.copy()
         cmap = LinearSegmentedColormap(
             name, segmentdata, N,
             alpha=alpha, gamma=gamma, cyclic=cyclic
@@ -1106,6 +1250,8 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
         cmap._rgba_bad = self._rgba_bad
         cmap._rgba_under = self._rgba_under
         cmap._rgba_over = self._rgba_over
+        if share:
+            cmap._link_lut(self)
         return cmap
 
     def to_listed(self, samples=10, **kwargs):
@@ -1150,6 +1296,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             ``.json``            JSON database of the channel segment data.
             ``.hex``             Comma-delimited list of HEX strings.
             ``.rgb``, ``.txt``   3-4 column table of channel values.
+            ``.npy``             Binary table of coordinates and channel values.
             ===================  ==========================================
 
         warn_on_failure : bool, optional
@@ -1200,12 +1347,12 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
             and not isinstance(colors[0], str)
         ):
             coords, colors = zip(*colors)
-        colors = [to_rgba(color) for color in colors]
+        colors = np.atleast_2d(to_rgba(list(colors)))  # translate in one pass
 
         # Build segmentdata
         keys = ('red', 'green', 'blue', 'alpha')
         cdict = {}
-        for key, values in zip(keys, zip(*colors)):
+        for key, values in zip(keys, colors.T):
             cdict[key] = _make_segmentdata_array(values, coords, ratios)
         return cls(name, cdict, **kwargs)
 
@@ -1251,6 +1398,15 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         if alpha is not None:
             self.set_alpha(alpha)
 
+    def _init(self):
+        # Use the lookup table shared by the colormap this was copied from
+        if not self._share_lut():
+            super()._init()
+
+    def _set_extremes(self, *args, **kwargs):
+        self._unshare_lut()
+        super()._set_extremes(*args, **kwargs)
+
     def append(self, *args, name=None, N=None, **kwargs):
         """
         Append arbitrary colormaps onto this colormap.
@@ -1301,11 +1457,12 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
             ==================  ====================================
             ``.hex`` (default)  Comma-delimited list of HEX strings.
             ``.rgb``, ``.txt``  3-4 column table of channel values.
+            ``.npy``            Binary table of coordinates and channel values.
             ==================  ====================================
 
         alpha : bool, optional
-            Whether to include an opacity column for ``.rgb``
-            and ``.txt`` files.
+            Whether to include an opacity column for ``.rgb``,
+            ``.txt``, and ``.npy`` files.
         """
         dirname = os.path.join('~', '.proplot', 'cycles')
         filename = self._parse_path(path, dirname, 'hex')
@@ -1313,8 +1470,11 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         # Save lookup table colors
         _, ext = os.path.splitext(filename)
         data = self._get_data(ext[1:], alpha=alpha)
-        with open(filename, 'w') as fh:
-            fh.write(data)
+        if ext[1:] == 'npy':
+            np.save(filename, data)
+        else:
+            with open(filename, 'w') as fh:
+                fh.write(data)
         print(f'Saved colormap to {filename!r}.')
 
     def set_alpha(self, alpha):
@@ -1330,7 +1490,8 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         for color in colors:
             color[3] = alpha
         self.colors = colors
-        self._init()
+        self._reset_lut()
+        _cmap_cache.discard(self)
 
     def shifted(self, shift=1, name=None):
         """
@@ -1392,6 +1553,7 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         """
         if name is None:
             name = self.name + '_copy'
+        share = colors is None and alpha is None
         if colors is None:
             colors = list(self.colors)  # copy
         if N is None:
@@ -1400,6 +1562,8 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
         cmap._rgba_bad = self._rgba_bad
         cmap._rgba_under = self._rgba_under
         cmap._rgba_over = self._rgba_over
+        if share:
+            cmap._link_lut(self)
         return cmap
 
     @classmethod
@@ -1417,6 +1581,7 @@ class ListedColormap(mcolors.ListedColormap, _Colormap):
             ==================  ==========================================
             ``.hex``            Comma-delimited list of HEX strings.
             ``.rgb``, ``.txt``  3-4 column table of channel values.
+            ``.npy``            Binary table of coordinates and channel values.
             ==================  ==========================================
 
         warn_on_failure : bool, optional
@@ -1510,21 +1675,21 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         As with `~matplotlib.colors.LinearSegmentedColormap`, but convert
         each value in the lookup table from ``self._space`` to RGB.
         """
+        # Use the lookup table shared by the colormap this was copied from
+        if self._share_lut():
+            return
+
         # First generate the lookup table
-        channels = ('hue', 'saturation', 'luminance')
-        inverses = (False, False, True)  # weight low chroma, high luminance
-        gammas = (1.0, self._gamma1, self._gamma2)
+        channels = ('hue', 'saturation', 'luminance', 'alpha')
+        inverses = (False, False, True, False)  # weight low chroma, high luminance
+        gammas = (1.0, self._gamma1, self._gamma2, 1.0)
+        if 'alpha' not in self._segmentdata:
+            channels = channels[:3]
         self._lut_hsl = np.ones((self.N + 3, 4), float)  # fill
-        for i, (channel, gamma, inverse) in enumerate(
-            zip(channels, gammas, inverses)
-        ):
-            self._lut_hsl[:-3, i] = make_mapping_array(
-                self.N, self._segmentdata[channel], gamma, inverse
-            )
-        if 'alpha' in self._segmentdata:
-            self._lut_hsl[:-3, 3] = make_mapping_array(
-                self.N, self._segmentdata['alpha']
-            )
+        self._lut_hsl[:-3, :len(channels)] = _make_mapping_arrays(
+            self.N, [self._segmentdata[channel] for channel in channels],
+            gammas, inverses
+        ).T
         self._lut_hsl[:-3, 0] %= 360
 
         # Make hues circular, set extremes i.e. copy HSL values
@@ -1533,8 +1698,7 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
         self._isinit = True
 
         # Now convert values to RGB and clip colors
-        for i in range(self.N + 3):
-            self._lut[i, :3] = to_rgb(self._lut[i, :3], self._space)
+        self._lut[:, :3] = _to_rgb_array(self._lut[:, :3], self._space)
         self._lut[:, :3] = _clip_colors(self._lut[:, :3], self._clip)
 
     @docstring.add_snippets
@@ -1552,7 +1716,8 @@ class PerceptuallyUniformColormap(LinearSegmentedColormap, _Colormap):
             self._gamma1 = gamma1
         if gamma2 is not None:
             self._gamma2 = gamma2
-        self._init()
+        self._reset_lut()
+        _cmap_cache.discard(self)
 
     def copy(
         self, name=None, segmentdata=None, N=None, *,
@@ -1574,6 +1739,7 @@ optional
         """
         if name is None:
             name = self.name + '_copy'
+        share = segmentdata is None and alpha is None
         if segmentdata is None:
             segmentdata = self._segmentdata.copy()
         if space is None:
@@ -1598,6 +1764,8 @@ optional
         cmap._rgba_bad = self._rgba_bad
         cmap._rgba_under = self._rgba_under
         cmap._rgba_over = self._rgba_over
+        if share:
+            cmap._link_lut(self)
         return cmap
 
     def to_linear_segmented(self, **kwargs):
@@ -1808,28 +1976,71 @@ def _interpolate_basic(x, x0, x1, y0, y1):
     return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
 
 
-def _interpolate_extrapolate(xq, x, y):
+def _interpolate_extrapolate(xq, x, y, out=None):
     """
     Efficient vectorized linear interpolation. Similar to `numpy.interp`
     except this does not truncate out-of-bounds values (i.e. is reversible).
+    The result has the same floating point type as `xq` and is placed in `out`
+    if it was passed.
     """
     # Follow example of make_mapping_array for efficient, vectorized
     # linear interpolation across multiple segments.
     # * Normal test puts values at a[i] if a[i-1] < v <= a[i]; for
     #   left-most data, satisfy a[0] <= v <= a[1]
-    # * searchsorted gives where xq[i] must be inserted so it is larger
-    #   than x[ind[i]-1] but smaller than x[ind[i]]
+    # * searchsorted on the interior points gives the segment index, with
+    #   out-of-bounds values extrapolated from the end segments
+    # NOTE: Operate on chunks of the flattened data so that the temporary
+    # segment index arrays stay small. Operations are done in-place on the output
+    # array, which may be the same as the input array.
     # yq = ma.masked_array(np.interp(xq, x, y), mask=ma.getmask(xq))
-    x = np.asarray(x)
-    y = np.asarray(y)
     xq = np.atleast_1d(xq)
-    idx = np.searchsorted(x, xq)
-    idx[idx == 0] = 1  # get normed value <0
-    idx[idx == len(x)] = len(x) - 1  # get normed value >0
-    distance = (xq - x[idx - 1]) / (x[idx] - x[idx - 1])
-    yq = distance * (y[idx] - y[idx - 1]) + y[idx - 1]
-    yq = ma.masked_array(yq, mask=ma.getmask(xq))
-    return yq
+    if out is None:
+        out = np.empty(xq.shape, xq.dtype if xq.dtype.kind == 'f' else float)
+    elif out.shape != xq.shape:
+        raise ValueError(f'Output shape {out.shape} must match shape {xq.shape}.')
+    elif not out.flags.c_contiguous:
+        raise ValueError('Output array must be C-contiguous.')
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x0, dx = x[:-1].astype(out.dtype), np.diff(x).astype(out.dtype)
+    y0, dy = y[:-1].astype(out.dtype), np.diff(y).astype(out.dtype)
+    xs, ys = xq.reshape(-1), out.reshape(-1)
+    chunk = 2 ** 16
+    for i in range(0, xs.size, chunk):
+        xc, yc = xs[i:i + chunk], ys[i:i + chunk]
+        idx = np.searchsorted(x[1:-1], xc) if x.size > 2 else 0
+        np.subtract(xc, x0[idx], out=yc)
+        yc /= dx[idx]
+        yc *= dy[idx]
+        yc += y0[idx]
+    return out
+
+
+def _process_value(value):
+    """
+    Return the data, the mask, and whether the data is scalar. Similar to
+    `~matplotlib.colors.Normalize.process_value` except floating point data
+    is neither upcast nor copied.
+    """
+    is_scalar = not np.iterable(value)
+    if is_scalar:
+        value = [value]
+    mask = ma.getmask(value)
+    data = np.asarray(ma.getdata(value))
+    if data.dtype.kind != 'f':  # integers and booleans
+        data = data.astype(np.promote_types(data.dtype, np.float32))
+    return data, mask, is_scalar
+
+
+def _restore_value(data, mask, is_scalar):
+    """
+    Restore the mask and the scalar status returned by `_process_value`.
+    """
+    if mask is not ma.nomask:
+        data = ma.masked_array(data, mask=mask, copy=False)
+    if is_scalar:
+        data = data[0]
+    return data
 
 
 class DiscreteNorm(mcolors.BoundaryNorm):
@@ -1842,6 +2053,9 @@ class DiscreteNorm(mcolors.BoundaryNorm):
     # WARNING: Must be child of BoundaryNorm. Many methods in ColorBarBase
     # test for class membership, crucially including _process_values(), which
     # if it doesn't detect BoundaryNorm will try to use DiscreteNorm.inverse().
+    _cache = OrderedDict()  # see _get_cache_key
+    _cache_size = 128
+
     @warnings._rename_kwargs('0.7', extend='unique')
     def __init__(
         self, levels, norm=None, cmap=None,
@@ -1946,14 +2160,98 @@ class DiscreteNorm(mcolors.BoundaryNorm):
                 + ', '.join(map(repr, uniques)) + '.'
             )
 
+        # Get the level bins and the color coordinates for each bin
+        # NOTE: Results are cached because figures often contain many plots
+        # with identical levels and normalizers.
+        key = self._get_cache_key(levels, norm, unique, step)
+        value = self._cache.get(key, None) if key is not None else None
+        if value is None:
+            value = self._get_bins(levels, norm, unique, step)
+            for array in value:  # shared between normalizers
+                array.flags.writeable = False
+            if key is not None:
+                self._cache[key] = value
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        levels, bins, mids, dest = value
+        self.N = levels.size
+        self.clip = clip
+        self.boundaries = levels.copy()  # cached arrays are read-only
+        self.vmin = norm.vmin = np.min(levels)
+        self.vmax = norm.vmax = np.max(levels)
+
+        # Attributes
+        # NOTE: If clip is True, we clip values to the centers of the end
+        # bins rather than vmin/vmax to prevent out-of-bounds colors from
+        # getting an in-bounds bin color due to landing on a bin edge.
+        # NOTE: With unique='min' the minimimum in-bounds and out-of-bounds
+        # colors are the same so clip=True will have no effect. Same goes
+        # for unique='max' with maximum colors.
+        # WARNING: For some reason must clip manually for LogNorm, or
+        # end up with unpredictable fill value, weird "out-of-bounds" colors
+        self._bmin = np.min(mids)
+        self._bmax = np.max(mids)
+        self._bins = bins
+        self._dest = dest
+        self._norm = norm
+        self._norm_clip = None
+        self._descending = descending
+        if isinstance(norm, mcolors.LogNorm):
+            self._norm_clip = (5e-249, None)
+
+    @staticmethod
+    def _get_cache_key(levels, norm, unique, step):
+        """
+        Return a key for the `DiscreteNorm` cache based on the level values and
+        the normalizer parameters, or ``None`` if the input cannot be cached.
+        """
+        # NOTE: Only normalizers whose parameters are known are cached. Arbitrary
+        # subclasses may store state that changes how the levels are normalized.
+        def _get_key(value):
+            if value is None or isinstance(value, (str, Number)):
+                return (type(value).__name__, value)
+            if isinstance(value, np.ndarray) and value.dtype != object:
+                if isinstance(value, ma.MaskedArray):
+                    raise TypeError
+                return (value.dtype.str, value.shape, value.tobytes())
+            if isinstance(value, (tuple, list)):
+                return tuple(map(_get_key, value))
+            raise TypeError
+        types = (
+            mcolors.Normalize, mcolors.LogNorm, mcolors.SymLogNorm,
+            mcolors.PowerNorm, LinearSegmentedNorm, DivergingNorm,
+            getattr(mcolors, 'TwoSlopeNorm', DivergingNorm),
+        )
+        if type(norm) not in types:
+            return None
+        attrs = (
+            'vmin', 'vmax', 'clip', 'vcenter', 'fair', 'gamma',
+            'linthresh', 'linscale', 'base', '_linscale_adj', '_base', '_x', '_y',
+        )
+        if not isinstance(levels, ma.MaskedArray):
+            levels = np.asarray(levels)
+        try:
+            return (
+                _get_key(levels), type(norm),
+                tuple(_get_key(getattr(norm, attr, None)) for attr in attrs),
+                unique, _get_key(step),
+            )
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _get_bins(levels, norm, unique, step):
+        """
+        Return the checked levels, the normalized level bins, the bin centers,
+        and the color coordinates for each bin.
+        """
         # Ensure monotonically increasing levels
         levels, _ = _check_levels(levels, allow_descending=False)
         bins, _ = _check_levels(norm(levels), allow_descending=False)
-        self.N = levels.size
-        self.clip = clip
-        self.boundaries = levels
-        self.vmin = norm.vmin = vmin = np.min(levels)
-        self.vmax = norm.vmax = vmax = np.max(levels)
+        vmin = norm.vmin = np.min(levels)
+        vmax = norm.vmax = np.max(levels)
         vcenter = getattr(norm, 'vcenter', None)
 
         # Get color coordinates corresponding to each bin, plus extra
@@ -1995,25 +2293,7 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         dest = norm(mids)
         dest[0] -= eps
         dest[-1] += eps
-
-        # Attributes
-        # NOTE: If clip is True, we clip values to the centers of the end
-        # bins rather than vmin/vmax to prevent out-of-bounds colors from
-        # getting an in-bounds bin color due to landing on a bin edge.
-        # NOTE: With unique='min' the minimimum in-bounds and out-of-bounds
-        # colors are the same so clip=True will have no effect. Same goes
-        # for unique='max' with maximum colors.
-        # WARNING: For some reason must clip manually for LogNorm, or
-        # end up with unpredictable fill value, weird "out-of-bounds" colors
-        self._bmin = np.min(mids)
-        self._bmax = np.max(mids)
-        self._bins = bins
-        self._dest = dest
-        self._norm = norm
-        self._norm_clip = None
-        self._descending = descending
-        if isinstance(norm, mcolors.LogNorm):
-            self._norm_clip = (5e-249, None)
+        return levels, bins, mids, dest
 
     def __call__(self, value, clip=None):
         """
@@ -2029,20 +2309,48 @@ class DiscreteNorm(mcolors.BoundaryNorm):
         """
         # Follow example of LinearSegmentedNorm, but perform no interpolation,
         # just use searchsorted to bin the data.
+        idx, mask, is_scalar = self._get_bin_index(value, clip)
+        yq = ma.array(self._dest[idx], mask=mask)
+        if is_scalar:
+            yq = np.atleast_1d(yq)[0]
+        return yq
+
+    def _get_bin_index(self, value, clip=None):
+        """
+        Return the level bin index for each data value, the data mask, and
+        whether the data is scalar.
+        """
+        # NOTE: For normalizers known to be monotonically increasing we can
+        # bin the data using the levels in data space and skip the normalizer.
+        # The data is first cast to double precision so that e.g. single precision
+        # values are clipped and binned the same way as double precision values.
+        xq, is_scalar = self.process_value(value)
+        monotonic = type(self._norm) in _monotonic_norms
+        if monotonic:
+            dtype = np.promote_types(self.boundaries.dtype, np.float64)
+            xq = xq.astype(dtype, copy=False)
         norm_clip = self._norm_clip
         if norm_clip:  # special extra clipping due to normalizer
-            value = np.clip(value, *norm_clip)
+            xq = np.clip(xq, *norm_clip)
         if clip is None:  # builtin clipping
             clip = self.clip
         if clip:  # note that np.clip can handle masked arrays
-            value = np.clip(value, self._bmin, self._bmax)
-        xq, is_scalar = self.process_value(value)
-        xq = self._norm(xq)
-        yq = self._dest[np.searchsorted(self._bins, xq)]
-        yq = ma.array(yq, mask=ma.getmask(xq))
-        if is_scalar:
-            yq = np.atleast_1d(yq)[0]
-        return yq
+            xq = np.clip(xq, self._bmin, self._bmax)
+        if monotonic:
+            data = ma.getdata(xq)
+            if isinstance(self._norm, (LinearSegmentedNorm, DivergingNorm)):
+                invalid = ~np.isfinite(data)  # mask like these normalizers
+            else:
+                invalid = np.isnan(data)
+            if isinstance(self._norm, mcolors.LogNorm):  # mask like LogNorm
+                invalid |= data <= 0
+            if invalid.any():
+                xq = ma.masked_where(invalid, xq, copy=False)
+            idx = np.searchsorted(self.boundaries, data)
+        else:
+            xq = self._norm(xq)
+            idx = np.searchsorted(self._bins, ma.getdata(xq))
+        return idx, ma.getmask(xq), is_scalar
 
     def inverse(self, value):  # noqa: U100
         """
@@ -2095,7 +2403,7 @@ class LinearSegmentedNorm(mcolors.Normalize):
         self._x = levels
         self._y = dest
 
-    def __call__(self, value, clip=None):
+    def __call__(self, value, clip=None, out=None):
         """
         Normalize the data values to 0-1. Inverse
         of `~LinearSegmentedNorm.inverse`.
@@ -2103,20 +2411,22 @@ class LinearSegmentedNorm(mcolors.Normalize):
         Parameters
         ----------
         value : numeric
-            The data to be normalized.
+            The data to be normalized. Floating point data keeps its type
+            and a masked array is returned only if the data is masked.
         clip : bool, optional
             Whether to clip values falling outside of the minimum and
             maximum levels. Default is ``self.clip``.
+        out : `~numpy.ndarray`, optional
+            The array in which to place the result. Must have the same shape
+            as `value` and may be `value` itself.
         """
+        xq, mask, is_scalar = _process_value(value)
         if clip is None:  # builtin clipping
             clip = self.clip
-        if clip:  # numpy.clip can handle masked arrays
-            value = np.clip(value, self.vmin, self.vmax)
-        xq, is_scalar = self.process_value(value)
-        yq = _interpolate_extrapolate(xq, self._x, self._y)
-        if is_scalar:
-            yq = np.atleast_1d(yq)[0]
-        return yq
+        if clip:
+            xq = np.clip(xq, self.vmin, self.vmax, out=out)
+        yq = _interpolate_extrapolate(xq, self._x, self._y, out=out)
+        return _restore_value(yq, mask, is_scalar)
 
     def inverse(self, value):
         """
@@ -2127,11 +2437,9 @@ class LinearSegmentedNorm(mcolors.Normalize):
         value : numeric
             The data to be un-normalized.
         """
-        yq, is_scalar = self.process_value(value)
+        yq, mask, is_scalar = _process_value(value)
         xq = _interpolate_extrapolate(yq, self._y, self._x)
-        if is_scalar:
-            xq = np.atleast_1d(xq)[0]
-        return xq
+        return _restore_value(xq, mask, is_scalar)
 
 
 class DivergingNorm(mcolors.Normalize):
@@ -2174,24 +2482,28 @@ class DivergingNorm(mcolors.Normalize):
         self.vcenter = vcenter
         self.fair = fair
 
-    def __call__(self, value, clip=None):
+    def __call__(self, value, clip=None, out=None):
         """
         Normalize data values to 0-1.
 
         Parameters
         ----------
         value : numeric
-            The data to be normalized.
+            The data to be normalized. Floating point data keeps its type
+            and a masked array is returned only if the data is masked.
         clip : bool, optional
             Whether to clip values falling outside of `vmin` and `vmax`.
             Default is ``self.clip``.
+        out : `~numpy.ndarray`, optional
+            The array in which to place the result. Must have the same shape
+            as `value` and may be `value` itself.
         """
-        xq, is_scalar = self.process_value(value)
-        self.autoscale_None(xq)  # sets self.vmin, self.vmax if None
+        xq, mask, is_scalar = _process_value(value)
+        self.autoscale_None(ma.masked_array(xq, mask=mask, copy=False))
         if clip is None:  # builtin clipping
             clip = self.clip
-        if clip:  # note that np.clip can handle masked arrays
-            value = np.clip(value, self.vmin, self.vmax)
+        if clip:
+            xq = np.clip(xq, self.vmin, self.vmax, out=out)
         if self.vmin > self.vmax:
             raise ValueError('vmin must be less than or equal to vmax.')
         elif self.vmin == self.vmax:
@@ -2213,10 +2525,8 @@ class DivergingNorm(mcolors.Normalize):
             )
             x = [self.vcenter - offset, self.vcenter + offset]
             y = [0, 1.0]
-        yq = _interpolate_extrapolate(xq, x, y)
-        if is_scalar:
-            yq = np.atleast_1d(yq)[0]
-        return yq
+        yq = _interpolate_extrapolate(xq, x, y, out=out)
+        return _restore_value(yq, mask, is_scalar)
 
     def autoscale_None(self, z):
         """
@@ -2244,23 +2554,23 @@ class ColorDatabase(dict):
             The colors.
         """
         super().__init__(mapping)
-        self._cache = _ColorCache({})
+        self._cache = _ColorCache()
 
     def __setitem__(self, key, value):
         """
-        Add a color to the database and clear the cache.
+        Add a color to the database and remove cached colors with this name.
         """
         if not isinstance(key, str):
             raise ValueError(f'Invalid color name {key!r}. Must be string.')
         super().__setitem__(key, value)
-        self.cache.clear()
+        self.cache.discard(key)
 
     def __delitem__(self, key):
         """
-        Delete a color from the database and clear the cache.
+        Delete a color from the database and remove cached colors with this name.
         """
         super().__delitem__(key)
-        self.cache.clear()
+        self.cache.discard(key)
 
     @property
     def cache(self):
@@ -2280,17 +2590,41 @@ class ColorDatabase(dict):
 
 
 class _ColorCache(dict):
+    """
+    Bounded cache of the RGBA colors returned by `~matplotlib.colors.to_rgba`.
+    Also retrieves and caches colors drawn from colormaps and color cycles.
+    """
+    def __init__(self, *args, maxsize=4096, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cmaps = {}  # cache key -> (colormap, colormap data, name)
+        self._names = {}  # color or colormap name -> cache keys
+        self.maxsize = maxsize
+
     def __getitem__(self, key):
         # Matplotlib 'color' args are passed to to_rgba, which tries to read
         # directly from cache and if that fails, sanitizes input, which
         # raises error on receiving (colormap, idx) tuple. So we *have* to
         # override cache instead of color dict itself.
+        # NOTE: Cached colormap colors are ignored if the colormap was modified
+        # in-place, which replaces the lookup table or the color list (see
+        # _reset_lut). Re-registered colormaps are removed with discard().
+        try:
+            rgba = super().__getitem__(key)
+        except KeyError:
+            pass
+        else:
+            entry = self._cmaps.get(key, None)
+            if entry is None or all(
+                a is b for a, b in zip(entry[1], self._get_data(entry[0]))
+            ):
+                return rgba
         rgb, alpha = key
         if (
             not isinstance(rgb, str) and np.iterable(rgb) and len(rgb) == 2
             and isinstance(rgb[1], Number) and isinstance(rgb[0], str)
         ):
             try:
+                name, *_ = _cmap_database._parse_key(rgb[0])
                 cmap = _cmap_database[rgb[0]]
             except (TypeError, KeyError):
                 pass
@@ -2311,7 +2645,75 @@ class _ColorCache(dict):
                         )
                     rgb = cmap(rgb[1])  # get color selection
                 rgba = mcolors.to_rgba(rgb, alpha)
+                self._set_item(key, rgba, ('cmap', name))
+                self._cmaps[key] = (cmap, self._get_data(cmap), name)
                 return rgba
+        raise KeyError(key)
+
+    @staticmethod
+    def _get_data(cmap):
+        return (cmap.__dict__.get('_lut', None), getattr(cmap, 'colors', None))
+
+    def __setitem__(self, key, rgba):
+        rgb = key[0] if isinstance(key, tuple) and key else None
+        name = ('color', rgb.lower()) if isinstance(rgb, str) else None
+        self._set_item(key, rgba, name)
+
+    def _set_item(self, key, rgba, name):
+        """
+        Add the color and record the color or colormap name it depends on.
+        """
+        self._discard_key(key)
+        super().__setitem__(key, rgba)
+        if name is not None:
+            self._names.setdefault(name, set()).add(key)
+        while len(self) > self.maxsize:
+            self._discard_key(next(iter(self)))
+
+    def _discard_key(self, key):
+        """
+        Remove the cached color and its dependency records.
+        """
+        if not super().__contains__(key):
+            return
+        super().__delitem__(key)
+        entry = self._cmaps.pop(key, None)
+        if entry is not None:
+            name = ('cmap', entry[2])
+        else:
+            rgb = key[0] if isinstance(key, tuple) and key else None
+            name = ('color', rgb.lower()) if isinstance(rgb, str) else None
+        keys = self._names.get(name, None)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._names[name]
+
+    def clear(self):
+        """
+        Clear the cache.
+        """
+        super().clear()
+        self._cmaps.clear()
+        self._names.clear()
+
+    def discard(self, name, cmap=False):
+        """
+        Remove colors that depend on the color name or, if `cmap` is ``True``,
+        on the registered colormap name.
+        """
+        name = ('cmap', name) if cmap else ('color', name.lower())
+        for key in tuple(self._names.get(name, ())):
+            self._discard_key(key)
+
+
+def _discard_colors(key):
+    """
+    Remove cached colors drawn from the colormap registered under this name.
+    """
+    cache = getattr(mcolors._colors_full_map, 'cache', None)
+    if isinstance(cache, _ColorCache):
+        cache.discard(key, cmap=True)
 
 
 def _get_cmap(name=None, lut=None):
@@ -2357,6 +2759,125 @@ def _to_proplot_colormap(cmap):
     return cmap
 
 
+class _ColormapCache(object):
+    """
+    Bounded least-recently-used cache of transformed colormaps. Entries are
+    keyed on the identity of the original colormap, the name of the method used
+    to transform it, and the method arguments. Entries are ignored if the state
+    of the original colormap changes.
+    """
+    def __init__(self, maxsize=128):
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+
+    @staticmethod
+    def _get_state(cmap):
+        # NOTE: Methods that modify colormaps in-place without changing these
+        # attributes (e.g. set_alpha) must call discard().
+        state = [cmap.N, cmap._rgba_bad, cmap._rgba_under, cmap._rgba_over]
+        for attr in ('_cyclic', '_gamma', '_gamma1', '_gamma2', '_space'):
+            value = getattr(cmap, attr, None)
+            state.append(tuple(value) if np.iterable(value) else value)
+        data = getattr(cmap, '_segmentdata', None)
+        data = getattr(cmap, 'colors', None) if data is None else data
+        state.append(id(data))
+        return tuple(
+            tuple(value) if isinstance(value, np.ndarray) else value
+            for value in state
+        )
+
+    def clear(self):
+        """
+        Clear the cache.
+        """
+        self._data.clear()
+
+    def discard(self, cmap):
+        """
+        Remove all transformations of the colormap from the cache.
+        """
+        for key in tuple(self._data):
+            if key[0] == id(cmap):
+                del self._data[key]
+
+    @staticmethod
+    def copy(cmap):
+        """
+        Return a shallow copy of the cached colormap. The copy shares the lookup
+        table with the cached colormap until either one is modified.
+        """
+        # NOTE: Cached colormaps are never returned directly so that e.g. calling
+        # set_under() on the result does not change subsequent lookups.
+        cls = type(cmap)
+        value = cls.__new__(cls)
+        value.__dict__.update(cmap.__dict__)
+        value._reset_lut()
+        value._lut_shared = False
+        if isinstance(getattr(value, '_segmentdata', None), dict):
+            value._segmentdata = value._segmentdata.copy()
+        if isinstance(getattr(value, 'colors', None), list):
+            value.colors = value.colors.copy()
+        value._link_lut(cmap)
+        return value
+
+    def transform(self, cmap, method, *args, **kwargs):
+        """
+        Return a copy of the cached result of calling the colormap method with
+        the arguments or call the method and cache the result.
+        """
+        return self.copy(self._transform(cmap, method, *args, **kwargs))
+
+    def _transform(self, cmap, method, *args, **kwargs):
+        """
+        Return the cached result itself. This is used to chain transformations.
+        """
+        try:
+            key = (id(cmap), method, args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:  # unhashable arguments
+            return getattr(cmap, method)(*args, **kwargs)
+        entry = self._data.get(key, None)
+        if entry is not None:
+            cmap_cached, state, value = entry
+            if cmap_cached is cmap and state == self._get_state(cmap):
+                self._data.move_to_end(key)
+                return value
+        value = getattr(cmap, method)(*args, **kwargs)
+        self._data[key] = (cmap, self._get_state(cmap), value)  # prevent id reuse
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+
+class _LazyColormap(object):
+    """
+    Placeholder for a colormap or color cycle that is loaded from
+    a file the first time it is retrieved from the `ColormapDatabase`.
+    """
+    def __repr__(self):
+        return f'{type(self).__name__}({self.path!r})'
+
+    def __init__(self, path, loader):
+        """
+        Parameters
+        ----------
+        path : str
+            The file path.
+        loader : callable
+            Function that accepts the path and returns the colormap or ``None``.
+        """
+        self.path = path
+        self.loader = loader
+        self.value = None  # the loaded colormap
+
+    def load(self):
+        """
+        Load the colormap.
+        """
+        return self.loader(self.path)
+
+
 class ColormapDatabase(dict):
     """
     Dictionary subclass used to replace the matplotlib
@@ -2370,6 +2891,8 @@ class ColormapDatabase(dict):
         kwargs : dict-like
             The source dictionary.
         """
+        self._aliases = {}  # see _index_key
+        self._lock = threading.RLock()  # see proplot.config._register_cmap_files
         for key, value in kwargs.items():
             self.__setitem__(key, value)
 
@@ -2377,8 +2900,11 @@ class ColormapDatabase(dict):
         """
         Delete the item from the database.
         """
-        key = self._sanitize_key(key, mirror=True)
-        super().__delitem__(key)
+        with self._lock:
+            key = self._sanitize_key(key, mirror=True)
+            super().__delitem__(key)
+            self._index_key(key)
+        _discard_colors(key)
 
     def __getitem__(self, key):
         """
@@ -2392,41 +2918,31 @@ class ColormapDatabase(dict):
         * Reversed diverging colormaps can be requested with their "reversed"
           name -- for example, ``'BuRd'`` is equivalent to ``'RdBu_r'``.
         """
-        # Sanitize key and handle suffixes
-        key = self._sanitize_key(key, mirror=True)
-        shift = key[-2:] == '_s'
-        if shift:
-            key = key[:-2]
-        reverse = key[-2:] == '_r'
-        if reverse:
-            key = key[:-2]
-
         # Get item and issue nice error message
-        try:
-            value = super().__getitem__(key)  # may raise keyerror
-        except KeyError:
-            raise KeyError(
-                f'Invalid colormap or cycle name {key!r}. Valid names are: '
-                + ', '.join(map(repr, self)) + '.'
-            )
+        key, reverse, shift = self._parse_key(key)
+        value = super().__getitem__(key)
+        if isinstance(value, _LazyColormap):
+            value = self._load_item(key, value)
 
         # Auto-reverse and auto-shift
+        # NOTE: Use the cache so that the lookup table for repeated lookups of
+        # e.g. 'RdBu_r' is only built once. Each lookup returns a new copy.
+        if reverse and not hasattr(value, 'reversed'):
+            raise KeyError(
+                f'Item of type {type(value).__name__!r} '
+                'does not have reversed() method.'
+            )
+        if shift and not hasattr(value, 'shifted'):
+            raise KeyError(
+                f'Item of type {type(value).__name__!r} '
+                'does not have shifted() method.'
+            )
         if reverse:
-            if hasattr(value, 'reversed'):
-                value = value.reversed()
-            else:
-                raise KeyError(
-                    f'Item of type {type(value).__name__!r} '
-                    'does not have reversed() method.'
-                )
+            value = _cmap_cache._transform(value, 'reversed')
         if shift:
-            if hasattr(value, 'shifted'):
-                value = value.shifted(180)
-            else:
-                raise KeyError(
-                    f'Item of type {type(value).__name__!r} '
-                    'does not have shifted() method.'
-                )
+            value = _cmap_cache._transform(value, 'shifted', 180)
+        if reverse or shift:
+            value = _cmap_cache.copy(value)
         return value
 
     def __setitem__(self, key, item):
@@ -2434,23 +2950,118 @@ class ColormapDatabase(dict):
         Store the colormap under its lowercase name. If the colormap is
         a matplotlib `~matplotlib.colors.ListedColormap` or
         `~matplotlib.colors.LinearSegmentedColormap`, it is converted to the
-        ProPlot `ListedColormap` or `LinearSegmentedColormap` subclass.
+        ProPlot `ListedColormap` or `LinearSegmentedColormap` subclass. Lazy
+        placeholders for colormap files are stored as-is and loaded when the
+        colormap is first retrieved.
         """
         if not isinstance(key, str):
             raise KeyError(f'Invalid key {key!r}. Must be string.')
         key = self._sanitize_key(key, mirror=False)
-        item = _to_proplot_colormap(item)
-        super().__setitem__(key, item)
+        if not isinstance(item, _LazyColormap):
+            item = _to_proplot_colormap(item)
+        with self._lock:
+            exists = super().__contains__(key)
+            super().__setitem__(key, item)
+            if not exists:
+                self._index_key(key)
+        _discard_colors(key)
 
     def __contains__(self, item):
         """
-        Test for membership using the sanitized colormap name.
+        Test for membership using the sanitized colormap name. This does
+        not load or transform any colormaps.
         """
-        try:  # by default __contains__ ignores __getitem__ overrides
-            self.__getitem__(item)
-            return True
+        # NOTE: By default __contains__ ignores __getitem__ overrides
+        return isinstance(item, str) and item.lower() in self._aliases
+
+    def get(self, key, default=None):
+        """
+        Return the colormap associated with the sanitized key name or `default`.
+        """
+        try:
+            return self.__getitem__(key)
         except KeyError:
-            return False
+            return default
+
+    def items(self):
+        """
+        Return a list of the colormap names and colormaps. Loads any
+        colormaps that have not yet been retrieved.
+        """
+        items = []
+        with self._lock:
+            for key in tuple(self):
+                try:
+                    items.append((key, self.__getitem__(key)))
+                except KeyError:  # failed to load
+                    pass
+        return items
+
+    def values(self):
+        """
+        Return a list of the colormaps. Loads any colormaps that have not
+        yet been retrieved.
+        """
+        return [value for _, value in self.items()]
+
+    def _load_item(self, key, item):
+        """
+        Load the lazy colormap and replace the placeholder. Remove the
+        placeholder and raise an error if loading failed.
+        """
+        value = item.load()
+        with self._lock:
+            if not value:
+                if super().get(key) is item:  # unless overwritten while loading
+                    super().__delitem__(key)
+                    self._index_key(key)
+                raise KeyError(f'Failed to load colormap or cycle {key!r}.')
+            value = item.value = _to_proplot_colormap(value)
+            if super().get(key) is item:
+                super().__setitem__(key, value)
+        return value
+
+    def _index_key(self, key):
+        """
+        Update the alias index for the names whose meaning depends on whether
+        this key is registered. The index translates lowercase colormap names,
+        reversed diverging colormap names, and names with ``'_r'`` and ``'_s'``
+        suffixes into the registered key and the required transformations.
+        """
+        names = {key}
+        if key in CMAPS_MIRRORS:
+            names.add(CMAPS_MIRRORS[key])
+        if key == 'greys':
+            names.add('grays')
+        for name in names:
+            for suffix in ('', '_r', '_s', '_r_s'):
+                alias = name + suffix
+                base = self._sanitize_key(alias, mirror=True)
+                shift = base[-2:] == '_s'
+                if shift:
+                    base = base[:-2]
+                reverse = base[-2:] == '_r'
+                if reverse:
+                    base = base[:-2]
+                if super().__contains__(base):
+                    self._aliases[alias] = (base, reverse, shift)
+                else:
+                    self._aliases.pop(alias, None)
+
+    def _parse_key(self, key):
+        """
+        Return the registered key for the colormap name and whether the
+        colormap should be reversed and shifted.
+        """
+        if not isinstance(key, str):
+            raise KeyError(f'Invalid key {key!r}. Key must be a string.')
+        try:
+            return self._aliases[key.lower()]
+        except KeyError:
+            raise KeyError(
+                f'Invalid colormap or cycle name {key.lower()!r}. Valid names '
+                'are: ' + ', '.join(map(repr, tuple(self))) + '.'
+            ) from None
 
     def _sanitize_key(self, key, mirror=True):
         """
@@ -2465,13 +3076,7 @@ class ColormapDatabase(dict):
         if reverse:
             key = key[:-2]
         if mirror and not super().__contains__(key):  # search for mirrored key
-            key_mirror = key
-            for pair in CMAPS_DIVERGING:
-                try:
-                    idx = pair.index(key)
-                    key_mirror = pair[1 - idx]
-                except (ValueError, KeyError):
-                    continue
+            key_mirror = CMAPS_MIRRORS.get(key, key)
             if super().__contains__(key_mirror):
                 reverse = not reverse
                 key = key_mirror
@@ -2480,6 +3085,16 @@ class ColormapDatabase(dict):
         return key
 
 
+# Cache of transformed colormaps
+_cmap_cache = _ColormapCache()
+
+# Normalizers that monotonically increase between the level boundaries
+_monotonic_norms = (
+    mcolors.Normalize, mcolors.LogNorm, mcolors.PowerNorm, mcolors.SymLogNorm,
+    LinearSegmentedNorm, DivergingNorm,
+)
+
+
 # Replace color database with custom database
 if not isinstance(mcolors._colors_full_map, ColorDatabase):
     _map = ColorDatabase(mcolors._colors_full_map)
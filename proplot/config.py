@@ -10,9 +10,16 @@ See the :ref:`configuration guide <ug_config>` for details.
 # Because I think it makes sense to have all the code that "runs" (i.e. not
 # just definitions) in the same place, and I was having issues with circular
 # dependencies and where import order of __init__.py was affecting behavior.
+import atexit
+import functools
+import json
 import logging
 import os
+import pickle
 import re
+import sys
+import threading
+import types
 from collections import namedtuple
 
 import cycler
@@ -27,8 +34,8 @@ import numpy as np
 
 from . import colors as pcolors
 from .internals import ic  # noqa: F401
-from .internals import _not_none, docstring, rcsetup, timers, warnings
-from .utils import to_xyz, units
+from .internals import _get_version, _not_none, docstring, rcsetup, timers, warnings
+from .utils import _hex_to_rgb_array, _to_xyz_array, units
 
 try:
     from IPython import get_ipython
@@ -36,6 +43,20 @@ except ImportError:
     def get_ipython():
         return
 
+try:
+    from contextvars import ContextVar
+except ImportError:  # python < 3.7
+    class ContextVar(threading.local):
+        def __init__(self, name, default=None):
+            self.name = name
+            self.value = default
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            self.value = value
+
 __all__ = [
     'rc', 'RcConfigurator',
     'register_cmaps', 'register_cycles', 'register_colors', 'register_fonts',
@@ -50,7 +71,13 @@ logger.setLevel(logging.ERROR)  # suppress warnings!
 rc_proplot = rcsetup._rc_proplot_default.copy()
 rc_matplotlib = mpl.rcParams  # PEP8 4 lyfe
 RcParams = mpl.RcParams  # the special class
-_RcContext = namedtuple('RcContext', ('mode', 'kwargs', 'rc_new', 'rc_old'))
+_RcContext = namedtuple(
+    'RcContext', ('mode', 'kwargs', 'rc_proplot', 'rc_matplotlib', 'token')
+)
+_rc_categories = {}  # category names -> setting names, see _get_category_keys
+_rc_categories_stamp = None
+_rc_keys = {}  # input setting names -> sanitized names, see _sanitize_key
+_rc_synced = {}  # setting names -> synced setting names, see _get_synced_keys
 
 # Misc constants
 # TODO: Use explicit validators for specific settings like matplotlib.
@@ -119,6 +146,17 @@ TRANSLATE_COLORS = (  # prevent registering similar-sounding names
 
 OPEN_COLORS = {}  # populated during register_colors
 XKCD_COLORS = {}  # populated during register_colors
+_fonts_filtered = None  # the font manager filtered by _filter_fonts
+_cmap_files = {}  # colormap and cycle files registered by _register_cmap_files
+_cmap_files_lock = pcolors._cmap_database._lock  # also guards the database
+_cmap_watchers = {}  # threads started by _watch_cmap_files
+_data_paths_cache = {}  # populated in read-only mode
+_readonly = os.environ.get('PROPLOT_READONLY', '').lower() not in (
+    '', '0', 'false', 'no', 'off',
+)
+_xkcd_distinct_file = os.path.join(
+    os.path.dirname(__file__), 'colors', 'xkcd_distinct.txt'
+)
 BASE_COLORS = {
     **mcolors.BASE_COLORS,  # shorthand names like 'r', 'g', etc.
     'blue': (0, 0, 1),
@@ -140,6 +178,14 @@ default : bool, optional
 docstring.snippets['register_cmaps.params'] = _config_docstring.format(name='colormaps')
 docstring.snippets['register_cycles.params'] = _config_docstring.format(name='cycles')
 docstring.snippets['register_colors.params'] = _config_docstring.format(name='colors')
+docstring.snippets['register.watch'] = """
+watch : bool or float, optional
+    Whether to periodically check the folders for new, modified, or deleted
+    files in a background thread and update the registered names. This is
+    useful for long-running sessions. If float, this is the interval in
+    seconds between checks. If ``True``, the interval is ``2``. If ``False``,
+    checking is stopped. Default is ``None`` (no change).
+"""
 docstring.snippets['rc.params'] = """
 local : bool, optional
     Whether to reload ``.proplotrc`` settings in this directory and parent
@@ -159,17 +205,22 @@ Extension           Description
 ``.hex``            List of HEX strings in any format (comma-separated, separate lines, with double quotes... anything goes).
 ``.xml``            XML files with ``<Point .../>`` tags specifying ``x``, ``r``, ``g``, ``b``, and (optionally) ``o`` parameters, where ``x`` is the coordinate and the rest are the red, blue, green, and opacity channel values.
 ``.rgb``, ``.txt``  3-4 column table of red, blue, green, and (optionally) opacity channel values, delimited by commas or spaces. If values larger than 1 are detected, they are assumed to be on the 0-255 scale and are divided by 255.
+``.npy``            Binary 4-5 column table of coordinates and red, blue, green, and (optionally) opacity channel values saved with `numpy.save` or the colormap ``save`` method. If a ``.npy`` file has the same name as a text file in the same folder and is not older than the text file, it is loaded instead.
 ==================  =====================================================================================================================================================================================================================
 """  # noqa: E501
 
 
 def _get_data_paths(subfolder, user=True, default=True, reverse=False):
     """
-    Return data folder paths in reverse order of precedence.
+    Return data folder paths in reverse order of precedence. In read-only
+    mode the paths are only computed once.
     """
     # When loading colormaps, cycles, and colors, files in the latter
     # directories overwrite files in the former directories. When loading
     # fonts, the resulting paths need to be *reversed*.
+    key = ('paths', subfolder, user, default, reverse)
+    if key in _data_paths_cache:
+        return list(_data_paths_cache[key])
     paths = []
     if user:
         paths.append(os.path.join(os.path.dirname(__file__), subfolder))
@@ -177,20 +228,362 @@ def _get_data_paths(subfolder, user=True, default=True, reverse=False):
         paths.append(os.path.join(os.path.expanduser('~'), '.proplot', subfolder))
     if reverse:
         paths = paths[::-1]
+    if _readonly:
+        _data_paths_cache[key] = tuple(paths)
     return paths
 
 
 def _iter_data_paths(subfolder, **kwargs):
     """
     Iterate over all files in the data paths. Also yield an index indicating
-    whether these are default ProPlot files or user files.
+    whether these are default ProPlot files or user files. In read-only mode
+    the files are only searched for once.
     """
+    key = ('files', subfolder, tuple(sorted(kwargs.items())))
+    if key in _data_paths_cache:
+        yield from _data_paths_cache[key]
+        return
+    items = []
     for i, path in enumerate(_get_data_paths(subfolder, **kwargs)):
         for dirname, dirnames, filenames in os.walk(path):
             for filename in filenames:
                 if filename[0] == '.':  # UNIX-style hidden files
                     continue
+                items.append((i, dirname, filename))
                 yield i, dirname, filename
+    if _readonly:
+        _data_paths_cache[key] = tuple(items)
+
+
+def _iter_cmap_paths(subfolder, **kwargs):
+    """
+    Iterate over the colormap or color cycle files in the data paths. Prefer
+    ``.npy`` "sidecar" files over files with the same name in the same folder
+    unless the latter were modified more recently.
+    """
+    groups = {}
+    for i, dirname, filename in _iter_data_paths(subfolder, **kwargs):
+        path = os.path.join(dirname, filename)
+        base, ext = os.path.splitext(path)
+        groups.setdefault(base, []).append((i, path, ext))
+    for items in groups.values():
+        sidecars = [item for item in items if item[2] == '.npy']
+        sources = [item for item in items if item[2] != '.npy']
+        if sidecars and sources:
+            mtime = os.path.getmtime(sidecars[0][1])
+            if all(os.path.getmtime(path) <= mtime for _, path, _ in sources):
+                items = sidecars
+            else:
+                items = sources
+        for i, path, _ in items:
+            yield i, path
+
+
+def _get_file_stamp(path):
+    """
+    Return the modification time and size of the file. Used to detect stale
+    entries in the `_RegistryCache`.
+    """
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _RegistryCache(object):
+    """
+    Persistent on-disk cache of the colormaps, color cycles, and color tables
+    parsed from the data folders. Entries are stored as pickled bytes alongside
+    the "stamps" of their source files and are ignored when the stamps change.
+    The entire cache is ignored when the proplot, matplotlib, numpy, or python
+    version changes, or when the proplot source changes in an unversioned checkout.
+    """
+    def __init__(self, path):
+        self._path = path
+        self._entries = None
+        self._dirty = False
+
+    @staticmethod
+    def _get_version_key():
+        # NOTE: Source and editable checkouts have no version, so use the source
+        # file stamps instead. Otherwise pickles survive changes to the classes.
+        version = _get_version('proplot')
+        if version == 'unknown':
+            folder = os.path.dirname(__file__)
+            version = tuple(
+                (name, _get_file_stamp(os.path.join(folder, name)))
+                for name in sorted(os.listdir(folder)) if name.endswith('.py')
+            )
+        return (version, mpl.__version__, np.__version__, sys.version_info[:2])
+
+    def _load(self):
+        # NOTE: Silently ignore corrupt or incompatible cache files. They are
+        # overwritten on the next save.
+        if self._entries is not None:
+            return self._entries
+        entries = {}
+        try:
+            with timers._benchmark('registry cache'):
+                with open(self._path, 'rb') as fh:
+                    version, entries = pickle.load(fh)
+            if version != self._get_version_key() or not isinstance(entries, dict):
+                entries = {}
+        except Exception:
+            entries = {}
+        self._entries = entries
+        return entries
+
+    def get(self, key, stamp):
+        """
+        Return the cached object or ``None`` if the entry is missing or stale.
+        """
+        entries = self._load()
+        stamp_cached, data = entries.get(key, (None, None))
+        if data is None or stamp_cached != stamp:
+            return
+        try:
+            return pickle.loads(data)
+        except Exception:
+            del entries[key]
+            self._dirty = True
+
+    def set(self, key, stamp, value):
+        """
+        Store a snapshot of the object. Subsequent changes to the object
+        are not reflected in the cache.
+        """
+        entries = self._load()
+        entries[key] = (stamp, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self._dirty = True
+
+    def save(self):
+        """
+        Write the cache to disk if it was modified. File-based entries whose
+        source files no longer exist are removed. Nothing is written in
+        read-only mode.
+        """
+        if not self._dirty or _readonly:
+            return
+        entries = self._load()
+        for key in tuple(entries):
+            if isinstance(key, str) and not os.path.isfile(key):
+                del entries[key]
+        tmp = self._path + f'.{os.getpid()}.tmp'
+        try:
+            with open(tmp, 'wb') as fh:
+                pickle.dump(
+                    (self._get_version_key(), entries), fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp, self._path)  # atomic
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        else:
+            self._dirty = False
+
+
+def _load_cmap_file(cls, path, cyclic=False):
+    """
+    Load a colormap or color cycle file from the registry cache or
+    parse it and add it to the registry cache.
+    """
+    with timers._benchmark(f'load {path}'):
+        try:
+            stamp = _get_file_stamp(path)
+        except OSError:  # deleted since registration
+            warnings._warn_proplot(f'Colormap or cycle file {path!r} not found.')
+            return
+        cmap = _registry_cache.get(path, stamp)
+        if cmap is None:
+            cmap = cls.from_file(path, warn_on_failure=True)
+            if not cmap:
+                return
+            _registry_cache.set(path, stamp, cmap)
+    # NOTE: Colormaps from the registry cache keep the image.lut used by the
+    # session that wrote the cache, so always apply the current setting.
+    lut = rc_matplotlib['image.lut']
+    if isinstance(cmap, mcolors.LinearSegmentedColormap) and cmap.N != lut:
+        cmap.N = lut
+        cmap._isinit = False
+    if cyclic:
+        cmap.set_cyclic(True)
+    return cmap
+
+
+def _register_cmap_file(cls, path, cyclic=False):
+    """
+    Register a placeholder that loads the colormap or color cycle file the first
+    time it is retrieved. Files with unknown extensions are loaded immediately
+    so that warnings are issued during registration. Return the placeholder
+    or colormap.
+    """
+    name, ext = os.path.splitext(os.path.basename(path))
+    if name[-2:] == '_r':  # see _from_file
+        name = name[:-2]
+    loader = functools.partial(_load_cmap_file, cls, cyclic=cyclic)
+    if ext in ('.json', '.hex', '.rgb', '.txt', '.xml', '.npy'):
+        cmap = pcolors._LazyColormap(path, loader)
+    else:
+        cmap = loader(path)
+        if not cmap:
+            return
+        name = cmap.name
+    pcolors._cmap_database[name] = cmap
+    return cmap
+
+
+def _get_cmap_file_key(path):
+    """
+    Return the database key for the colormap or color cycle file.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    if name[-2:] == '_r':  # see _register_cmap_file
+        name = name[:-2]
+    return pcolors._cmap_database._sanitize_key(name, mirror=False)
+
+
+def _register_cmap_files(subfolder, cls, cyclic=(), user=True, default=False):
+    """
+    Register the colormap or color cycle files in the data folders. Files that
+    were already registered and have not changed are skipped, and colormaps
+    registered from files that no longer exist are removed or replaced by the
+    colormaps they shadowed. Files in the first folder whose names are in
+    `cyclic` are registered as cyclic colormaps.
+    """
+    # NOTE: Files registered under the same name are resolved before registering
+    # so that each name is registered at most once.
+    database = pcolors._cmap_database
+    roots = _get_data_paths(subfolder, user=user, default=default)
+    files = {}
+    for i, path in _iter_cmap_paths(subfolder, user=user, default=default):
+        files[_get_cmap_file_key(path)] = (i, path)
+    with _cmap_files_lock:
+        records = _cmap_files.setdefault(subfolder, {})
+        for key, (i, path) in files.items():
+            try:
+                stamp = _get_file_stamp(path)
+            except OSError:  # deleted since the search
+                continue
+            record = records.get(key, None)
+            if (
+                record is not None and record[1:3] == (path, stamp)
+                and _is_cmap_registered(key, record[3])
+            ):
+                continue
+            if record is None:  # the colormap shadowed by the file
+                shadowed = dict.get(database, key, None)
+                shadowed = getattr(shadowed, 'value', None) or shadowed
+            else:
+                shadowed = record[4]
+            name = os.path.splitext(os.path.basename(path))[0]
+            cmap = _register_cmap_file(
+                cls, path, cyclic=(i == 0 and name.lower() in cyclic)
+            )
+            if cmap is None:
+                records.pop(key, None)
+            else:
+                records[key] = (roots[i], path, stamp, cmap, shadowed)
+        for key, (root, path, _, cmap, shadowed) in tuple(records.items()):
+            if key in files or root not in roots:
+                continue
+            if not _is_cmap_registered(key, cmap):
+                pass
+            elif shadowed is None:
+                del database[key]
+            else:
+                database[key] = shadowed
+            del records[key]
+
+
+def _is_cmap_registered(key, cmap):
+    """
+    Return whether the placeholder or colormap, or the colormap loaded by the
+    placeholder, is still registered under the key.
+    """
+    value = dict.get(pcolors._cmap_database, key, None)
+    return value is not None and (
+        value is cmap or value is getattr(cmap, 'value', None)
+    )
+
+
+class _CmapWatcher(threading.Thread):
+    """
+    Daemon thread that periodically registers new or modified colormap
+    or color cycle files and removes deleted files.
+    """
+    def __init__(self, interval, *args, **kwargs):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.args = args
+        self.kwargs = kwargs
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                _register_cmap_files(*self.args, **self.kwargs)
+            except Exception as err:
+                warnings._warn_proplot(f'Failed to refresh {self.args[0]!r}: {err}')
+
+
+def _watch_cmap_files(watch, subfolder, *args, **kwargs):
+    """
+    Start or stop the thread that refreshes the files in the subfolder.
+    """
+    if watch is None:
+        return
+    watcher = _cmap_watchers.pop(subfolder, None)
+    if watcher is not None:
+        watcher.stopped.set()
+    if watch is False or watch == 0:
+        return
+    interval = 2.0 if watch is True else float(watch)
+    watcher = _cmap_watchers[subfolder] = _CmapWatcher(
+        interval, subfolder, *args, **kwargs
+    )
+    watcher.start()
+
+
+class _RcState(object):
+    """
+    Immutable stack of the context blocks used by the current thread or
+    asyncio task. Context blocks are added and removed by replacing the state.
+    """
+    __slots__ = ('contexts', 'view')
+
+    def __init__(self, contexts=()):
+        """
+        Parameters
+        ----------
+        contexts : tuple of `_RcContext`, optional
+            The context blocks from outermost to innermost.
+        """
+        # NOTE: Settings from outer context blocks have precedence over
+        # settings from inner blocks in rc_new. This is how _get_item has
+        # always worked. The current values come from the innermost blocks.
+        rc_new = {}
+        kw_proplot = {}
+        for context in contexts:
+            if context.rc_proplot is not None:  # context was entered
+                kw_proplot.update(context.rc_proplot)
+        for context in contexts[::-1]:
+            if context.rc_proplot is not None:
+                rc_new.update(context.rc_proplot)
+                rc_new.update(context.rc_matplotlib)
+        mode = min((context.mode for context in contexts), default=0)
+        self.contexts = contexts
+        self.view = (rc_new, mode, kw_proplot)
+
+
+# The context blocks used by the current thread or task
+_rc_state = ContextVar('rc_state', default=_RcState())
+
+# The matplotlib settings applied by entered context blocks in all threads and
+# tasks, and the values they replaced. See RcConfigurator.__enter__.
+_rc_matplotlib_lock = threading.RLock()
+_rc_matplotlib_blocks = []  # (token, settings) in the order blocks were entered
+_rc_matplotlib_saved = {}  # setting names -> values before the blocks
 
 
 class RcConfigurator(object):
@@ -238,47 +631,74 @@ class RcConfigurator(object):
         ----------
         %(rc.params)s
         """
-        self._context = []
         self.reset(local=local, user=user, default=default)
 
     def __enter__(self):
         """
         Apply settings from the most recent context block.
         """
-        if not self._context:
+        # NOTE: The proplot settings are stored in the context block rather than
+        # written to rc_proplot, so blocks in other threads and tasks are
+        # unaffected. Matplotlib reads rcParams directly, so the matplotlib
+        # settings are written to rc_matplotlib for all threads. The values they
+        # replaced are saved until the last block that changed them exits.
+        state = _rc_state.get()
+        if not state.contexts:
             raise RuntimeError(
                 'rc object must be initialized for context block '
                 'using rc.context().'
             )
-        context = self._context[-1]
-        kwargs = context.kwargs
-        rc_new = context.rc_new  # used for context-based _get_item
-        rc_old = context.rc_old  # used to re-apply settings without copying whole dict
-        for key, value in kwargs.items():
-            kw_proplot, kw_matplotlib = self._get_synced_params(key, value)
-            for rc_dict, kw_new in zip(
-                (rc_proplot, rc_matplotlib),
-                (kw_proplot, kw_matplotlib),
-            ):
-                for key, value in kw_new.items():
-                    rc_old[key] = rc_dict[key]
-                    rc_new[key] = rc_dict[key] = value
+        context = state.contexts[-1]
+        try:
+            kw_proplot, kw_matplotlib = self._get_synced_dicts(context.kwargs)
+            kw_valid = self._validate_params(kw_matplotlib)
+        except Exception:
+            _rc_state.set(_RcState(state.contexts[:-1]))
+            raise
+        token = object()
+        with _rc_matplotlib_lock:
+            kw_old = self._update_matplotlib(kw_valid, validate=False)
+            for key, value in kw_old.items():
+                _rc_matplotlib_saved.setdefault(key, value)
+            _rc_matplotlib_blocks.append((token, kw_valid))
+        context = context._replace(
+            rc_proplot=types.MappingProxyType(kw_proplot),
+            rc_matplotlib=types.MappingProxyType(kw_matplotlib),
+            token=token,
+        )
+        _rc_state.set(_RcState((*state.contexts[:-1], context)))
 
     def __exit__(self, *args):  # noqa: U100
         """
         Restore settings from the most recent context block.
         """
-        if not self._context:
+        # NOTE: Context blocks in different threads may exit in any order. Each
+        # setting is restored to the value from the most recently entered block
+        # that is still active, or to the value saved before the first block.
+        state = _rc_state.get()
+        if not state.contexts:
             raise RuntimeError(
                 'rc object must be initialized for context block '
                 'using rc.context().'
             )
-        context = self._context[-1]
-        for key, value in context.rc_old.items():
-            kw_proplot, kw_matplotlib = self._get_synced_params(key, value)
-            rc_proplot.update(kw_proplot)
-            rc_matplotlib.update(kw_matplotlib)
-        del self._context[-1]
+        context = state.contexts[-1]
+        _rc_state.set(_RcState(state.contexts[:-1]))
+        with _rc_matplotlib_lock:
+            blocks = _rc_matplotlib_blocks
+            index = [i for i, (token, _) in enumerate(blocks) if token is context.token]
+            kw_block = blocks.pop(index[0])[1] if index else {}
+            kw_restore = {}
+            for key in kw_block:
+                for _, kw in reversed(blocks):
+                    if key in kw:
+                        kw_restore[key] = kw[key]
+                        break
+                else:
+                    kw_restore[key] = _rc_matplotlib_saved.pop(key)
+            self._update_matplotlib(kw_restore, validate=False)
+        for key in ('inlinefmt', 'benchmark'):  # settings with side effects
+            if context.rc_proplot and key in context.rc_proplot:
+                self._get_synced_params(key, self[key])
 
     def __delitem__(self, item):  # noqa: 100
         """
@@ -310,11 +730,14 @@ class RcConfigurator(object):
         key = self._sanitize_key(key)
         if key is None:  # means key was *removed*, warnings was issued
             return None
-        for kw in (rc_proplot, rc_matplotlib):
-            try:
+        kw_proplot = _rc_state.get().view[2]
+        for kw in (kw_proplot, rc_proplot):
+            if key in kw:
                 return kw[key]
-            except KeyError:
-                continue
+        try:
+            return rc_matplotlib[key]
+        except KeyError:
+            pass
         raise KeyError(f'Invalid setting name {key!r}.')
 
     def __setattr__(self, attr, value):
@@ -332,14 +755,29 @@ class RcConfigurator(object):
         a ProPlot :ref:`added setting <rc_proplot>`.
         """
         kw_proplot, kw_matplotlib = self._get_synced_params(key, value)
-        rc_proplot.update(kw_proplot)
-        rc_matplotlib.update(kw_matplotlib)
+        self._update_params(kw_proplot, kw_matplotlib)
+
+    @property
+    def _context(self):
+        """
+        The context blocks used by the current thread or task.
+        """
+        return _rc_state.get().contexts
 
     def _get_context_mode(self):
         """
         Return lowest (most permissive) context mode.
         """
-        return min((context.mode for context in self._context), default=0)
+        return self._get_context_view()[1]
+
+    @staticmethod
+    def _get_context_view():
+        """
+        Return dictionaries of the settings changed by the context blocks in
+        the current thread or task and the lowest context mode. The result is
+        computed when a context block is added, entered, or exited.
+        """
+        return _rc_state.get().view
 
     def _get_item(self, key, mode=None):
         """
@@ -347,15 +785,15 @@ class RcConfigurator(object):
         based on the context mode and ``None`` is returned if the key is not
         found in the dictionaries.
         """
+        rc_new, mode_context, kw_proplot = self._get_context_view()
         if mode is None:
-            mode = self._get_context_mode()
-        cache = tuple(context.rc_new for context in self._context)
+            mode = mode_context
         if mode == 0:
-            rcdicts = (*cache, rc_proplot, rc_matplotlib)
+            rcdicts = (rc_new, kw_proplot, rc_proplot, rc_matplotlib)
         elif mode == 1:
-            rcdicts = (*cache, rc_proplot)  # custom only!
+            rcdicts = (rc_new, kw_proplot, rc_proplot)  # custom only!
         elif mode == 2:
-            rcdicts = (*cache,)
+            rcdicts = (rc_new,)
         else:
             raise KeyError(f'Invalid caching mode {mode!r}.')
         for rcdict in rcdicts:
@@ -370,15 +808,83 @@ class RcConfigurator(object):
         else:
             return
 
-    def _get_synced_params(self, key, value):
+    @staticmethod
+    def _set_context_params(kw_proplot):
+        """
+        Apply proplot settings that were changed by context blocks in the current
+        thread or task to the innermost blocks that changed them. Return a
+        dictionary of the remaining settings for updating `rc_proplot`.
+        """
+        # NOTE: This is consistent with the old behavior where settings
+        # changed by a context block were restored when the block exited.
+        # Matplotlib settings are always written to rc_matplotlib and are
+        # restored from the saved values when the block exits.
+        state = _rc_state.get()
+        if not state.contexts:
+            return kw_proplot
+        kw_proplot = kw_proplot.copy()
+        changed = False
+        contexts = list(state.contexts)
+        for i, context in reversed(tuple(enumerate(contexts))):
+            if context.rc_proplot is None:  # context was not entered
+                continue
+            ikw_proplot = {
+                key: kw_proplot.pop(key) for key in tuple(kw_proplot)
+                if key in context.rc_proplot
+            }
+            if ikw_proplot:
+                contexts[i] = context._replace(
+                    rc_proplot=types.MappingProxyType(
+                        {**context.rc_proplot, **ikw_proplot}
+                    ),
+                )
+                changed = True
+        if changed:
+            _rc_state.set(_RcState(tuple(contexts)))
+        return kw_proplot
+
+    def _update_params(self, kw_proplot, kw_matplotlib):
+        """
+        Update `rc_matplotlib` and update `rc_proplot` with the settings that
+        were not changed by context blocks.
+        """
+        self._update_matplotlib(kw_matplotlib)
+        kw_proplot = self._set_context_params(kw_proplot)
+        rc_proplot.update(kw_proplot)
+
+    def _update_matplotlib(self, kw_matplotlib, validate=True):
+        """
+        Validate the matplotlib settings and write them to `rc_matplotlib` with
+        a single update. Return the previous values, which can be passed
+        with ``validate=False`` to restore them.
+        """
+        # NOTE: Deprecated matplotlib names are not in the validators and are
+        # translated by RcParams.__setitem__, so they are written one by one.
+        kw_valid = {}
+        kw_other = {}
+        for key, value in kw_matplotlib.items():
+            if key in RcParams.validate:
+                kw_valid[key] = value
+            else:
+                kw_other[key] = value
+        if validate:
+            kw_valid = self._validate_params(kw_valid)
+        kw_old = {key: dict.__getitem__(rc_matplotlib, key) for key in kw_valid}
+        kw_old.update({key: rc_matplotlib[key] for key in kw_other})
+        dict.update(rc_matplotlib, kw_valid)
+        rc_matplotlib.update(kw_other)
+        return kw_old
+
+    def _get_synced_params(self, key, value, kw_pending=None):
         """
         Return dictionaries for updating the `rc_proplot`
         and `rc_matplotlib` properties associated with this key.
+        Linked settings are derived from `kw_pending` if possible.
         """
         key = self._sanitize_key(key)
         if key is None:  # means setting was removed
-            return {}, {}, {}
-        keys = (key,) + rcsetup._rc_children.get(key, ())  # settings to change
+            return {}, {}
+        keys_proplot, keys_matplotlib, points = self._get_synced_keys(key)
         value = self._sanitize_value(value)
         kw_proplot = {}  # custom properties that global setting applies to
         kw_matplotlib = {}  # builtin properties that global setting applies to
@@ -387,7 +893,7 @@ class RcConfigurator(object):
         # See: https://matplotlib.org/users/customizing.html, props matching
         # the below strings use the units 'points'.
         # TODO: Incorporate into more sophisticated validation system
-        if any(REGEX_POINTS.match(_) for _ in keys):
+        if points:
             try:
                 self._scale_font(value)  # *validate* but do not translate
             except KeyError:
@@ -397,6 +903,10 @@ class RcConfigurator(object):
         if key == 'inlinefmt':
             config_inline_backend(value)
 
+        # Special key: toggle timing
+        elif key == 'benchmark':
+            timers.BENCHMARK = bool(value)
+
         # Special key: apply stylesheet
         elif key == 'style':
             if value is not None:
@@ -411,7 +921,9 @@ class RcConfigurator(object):
         # Zero linewidth almost always means zero tick length
         # TODO: Document this feature
         elif key == 'linewidth' and value == 0:
-            ikw_proplot, ikw_matplotlib = self._get_synced_params('ticklen', 0)
+            ikw_proplot, ikw_matplotlib = self._get_synced_params(
+                'ticklen', 0, kw_pending
+            )
             kw_proplot.update(ikw_proplot)
             kw_matplotlib.update(ikw_matplotlib)
 
@@ -419,9 +931,9 @@ class RcConfigurator(object):
         elif key in ('tick.len', 'tick.lenratio'):
             if key == 'tick.len':
                 ticklen = value
-                ratio = rc_proplot['tick.lenratio']
+                ratio = self._get_pending('tick.lenratio', kw_pending)
             else:
-                ticklen = rc_proplot['tick.len']
+                ticklen = self._get_pending('tick.len', kw_pending)
                 ratio = value
             kw_matplotlib['xtick.minor.size'] = ticklen * ratio
             kw_matplotlib['ytick.minor.size'] = ticklen * ratio
@@ -430,9 +942,9 @@ class RcConfigurator(object):
         elif key in ('linewidth', 'tick.ratio'):
             if key == 'linewidth':
                 tickwidth = value
-                ratio = rc_proplot['tick.ratio']
+                ratio = self._get_pending('tick.ratio', kw_pending)
             else:
-                tickwidth = rc_proplot['linewidth']
+                tickwidth = self._get_pending('linewidth', kw_pending)
                 ratio = value
             kw_matplotlib['xtick.minor.width'] = tickwidth * ratio
             kw_matplotlib['ytick.minor.width'] = tickwidth * ratio
@@ -441,9 +953,9 @@ class RcConfigurator(object):
         elif key in ('grid.linewidth', 'grid.ratio'):
             if key == 'grid.linewidth':
                 gridwidth = value
-                ratio = rc_proplot['grid.ratio']
+                ratio = self._get_pending('grid.ratio', kw_pending)
             else:
-                gridwidth = rc_matplotlib['grid.linewidth']
+                gridwidth = self._get_pending('grid.linewidth', kw_pending)
                 ratio = value
             kw_proplot['gridminor.linewidth'] = gridwidth * ratio
 
@@ -451,8 +963,8 @@ class RcConfigurator(object):
         # implemented in matplotlib. There should be a gridminor setting!
         elif key in ('grid', 'gridminor'):
             b = value
-            ovalue = rc_matplotlib['axes.grid']
-            owhich = rc_matplotlib['axes.grid.which']
+            ovalue = self._get_pending('axes.grid', kw_pending)
+            owhich = self._get_pending('axes.grid.which', kw_pending)
 
             # Instruction is to turn off gridlines
             if not value:
@@ -497,15 +1009,63 @@ class RcConfigurator(object):
             kw_matplotlib['axes.grid.which'] = which
 
         # Update original setting and linked settings
-        for key in keys:
-            if key in rc_proplot:
-                kw_proplot[key] = value
-            elif key in rc_matplotlib:
-                kw_matplotlib[key] = value
-            else:
-                raise KeyError(f'Invalid rc key {key!r}.')
+        for key in keys_proplot:
+            kw_proplot[key] = value
+        for key in keys_matplotlib:
+            kw_matplotlib[key] = value
+        return kw_proplot, kw_matplotlib
+
+    def _get_synced_dicts(self, kw):
+        """
+        Return dictionaries for updating the `rc_proplot` and `rc_matplotlib`
+        properties associated with every key in the input dictionary. Linked
+        settings are derived from the settings that precede them.
+        """
+        kw_proplot = {}
+        kw_matplotlib = {}
+        kw_pending = {}  # both dictionaries, used to derive linked settings
+        for key, value in kw.items():
+            ikw_proplot, ikw_matplotlib = self._get_synced_params(
+                key, value, kw_pending
+            )
+            kw_proplot.update(ikw_proplot)
+            kw_matplotlib.update(ikw_matplotlib)
+            kw_pending.update(ikw_proplot)
+            kw_pending.update(ikw_matplotlib)
         return kw_proplot, kw_matplotlib
 
+    def _get_pending(self, key, kw_pending=None):
+        """
+        Return the pending setting if possible and the current setting otherwise.
+        """
+        if kw_pending and key in kw_pending:
+            return kw_pending[key]
+        return self[key]
+
+    @staticmethod
+    def _get_synced_keys(key):
+        """
+        Return the proplot and matplotlib settings changed along with the
+        setting and whether any of them use point units. Results are cached.
+        """
+        try:
+            return _rc_synced[key]
+        except KeyError:
+            pass
+        keys = (key,) + rcsetup._rc_children.get(key, ())  # settings to change
+        keys_proplot = []
+        keys_matplotlib = []
+        for ikey in keys:
+            if ikey in rc_proplot:
+                keys_proplot.append(ikey)
+            elif ikey in rc_matplotlib:
+                keys_matplotlib.append(ikey)
+            else:
+                raise KeyError(f'Invalid rc key {ikey!r}.')
+        points = any(REGEX_POINTS.match(_) for _ in keys)
+        synced = _rc_synced[key] = (tuple(keys_proplot), tuple(keys_matplotlib), points)
+        return synced
+
     @staticmethod
     def _get_local_paths():
         """
@@ -538,27 +1098,37 @@ class RcConfigurator(object):
         """
         if not isinstance(key, str):
             raise KeyError(f'Invalid key {key!r}. Must be string.')
+        try:
+            return _rc_keys[key]
+        except KeyError:
+            pass
+        key_orig = key
 
         # Translate from nodots to 'full' version
         if '.' not in key:
             key = rcsetup._rc_nodots.get(key, key)
 
         # Handle deprecations
+        # NOTE: Deprecated and invalid keys are not cached so that warnings
+        # are issued every time and the cache cannot grow indefinitely.
         if key in rcsetup._rc_removed:
             alternative, version = rcsetup._rc_removed[key]
             message = f'rc setting {key!r} was removed in version {version}.'
             if alternative:  # provide an alternative
                 message = f'{message} {alternative}'
-            warnings._warn_proplot(warnings)
-            key = None
+            warnings._warn_proplot(message)
+            return None
         if key in rcsetup._rc_renamed:
             key_new, version = rcsetup._rc_renamed[key]
             warnings._warn_proplot(
                 f'rc setting {key!r} was renamed to {key_new} in version {version}.'
             )
-            key = key_new
+            return key_new.lower()
 
-        return key.lower()
+        key = key.lower()
+        if key in rc_proplot or key in rc_matplotlib:
+            _rc_keys[key_orig] = key
+        return key
 
     @staticmethod
     def _sanitize_value(value):
@@ -572,6 +1142,22 @@ class RcConfigurator(object):
                 value = value.tolist()
         return value
 
+    @staticmethod
+    def _validate_params(kw_matplotlib):
+        """
+        Validate matplotlib settings as with `~matplotlib.RcParams.__setitem__`.
+        """
+        kw = {}
+        for key, value in kw_matplotlib.items():
+            validate = RcParams.validate.get(key, None)
+            if validate is not None:
+                try:
+                    value = validate(value)
+                except ValueError as err:
+                    raise ValueError(f'Key {key}: {err}') from None
+            kw[key] = value
+        return kw
+
     @staticmethod
     def _scale_font(size):
         """
@@ -618,18 +1204,35 @@ class RcConfigurator(object):
             )
         kw = {}
         mode = 0 if not context else None
-        for rcdict in (rc_proplot, rc_matplotlib):
-            for key in rcdict:
-                if not re.match(fr'\A{cat}\.[^.]+\Z', key):
-                    continue
-                value = self._get_item(key, mode)
-                if value is None:
-                    continue
-                if trimcat:
-                    key = re.sub(fr'\A{cat}\.', '', key)
-                kw[key] = value
+        for key in self._get_category_keys(cat):
+            value = self._get_item(key, mode)
+            if value is None:
+                continue
+            if trimcat:
+                key = key[len(cat) + 1:]
+            kw[key] = value
         return kw
 
+    @staticmethod
+    def _get_category_keys(cat):
+        """
+        Return the setting names in the category. The category index is
+        rebuilt when settings are added.
+        """
+        # NOTE: Settings are never removed, so the number of settings is
+        # enough to detect changes.
+        global _rc_categories_stamp
+        stamp = (len(rc_proplot), len(rc_matplotlib))
+        if stamp != _rc_categories_stamp:
+            _rc_categories.clear()
+            for rcdict in (rc_proplot, rc_matplotlib):
+                for key in rcdict:
+                    parent, _, _ = key.rpartition('.')
+                    if parent:
+                        _rc_categories.setdefault(parent, []).append(key)
+            _rc_categories_stamp = stamp
+        return _rc_categories.get(cat, ())
+
     def context(self, *args, mode=0, file=None, **kwargs):
         """
         Temporarily modify the rc settings in a "with as" block.
@@ -673,6 +1276,12 @@ class RcConfigurator(object):
         gratuitous lookups increased runtime significantly, and resulted in successive
         calls to `~proplot.axes.Axes.format` overwriting the previous calls.
 
+        ProPlot's :ref:`added settings <rc_proplot>` are only applied in the
+        current thread or `asyncio` task. Matplotlib's `builtin settings
+        <rc_matplotlib>`_ are global, so while the block is active they also
+        apply to figures drawn in other threads. They are restored when the
+        last block that changed them exits.
+
         Example
         -------
         The below applies settings to axes in a specific figure using
@@ -706,8 +1315,9 @@ class RcConfigurator(object):
         # Activate context object
         if mode not in range(3):
             raise ValueError(f'Invalid mode {mode!r}.')
-        context = _RcContext(mode=mode, kwargs=kwargs, rc_new={}, rc_old={})
-        self._context.append(context)
+        state = _rc_state.get()
+        context = _RcContext(mode, kwargs, None, None, None)  # see __enter__
+        _rc_state.set(_RcState((*state.contexts, context)))
         return self
 
     def get(self, key, *, context=False):
@@ -786,8 +1396,9 @@ class RcConfigurator(object):
         if prefix:
             prefix = prefix + '.'
         kw.update(kwargs)
-        for key, value in kw.items():
-            self.__setitem__(prefix + key, value)
+        kw = {prefix + key: value for key, value in kw.items()}
+        kw_proplot, kw_matplotlib = self._get_synced_dicts(kw)
+        self._update_params(kw_proplot, kw_matplotlib)
 
     @docstring.add_snippets
     def reset(self, local=True, user=True, default=True):
@@ -799,18 +1410,20 @@ class RcConfigurator(object):
         %(rc.params)s
         """
         # Always remove context objects
-        self._context.clear()
+        _rc_state.set(_RcState())
+        with _rc_matplotlib_lock:
+            _rc_matplotlib_blocks.clear()
+            _rc_matplotlib_saved.clear()
 
         # Update from default settings
         # NOTE: see _remove_blacklisted_style_params bugfix
         if default:
-            rc_matplotlib.update(_get_style_dicts('original', filter=False))
-            rc_matplotlib.update(rcsetup._rc_matplotlib_default)
-            rc_proplot.update(rcsetup._rc_proplot_default)
-            for key, value in rc_proplot.items():
-                kw_proplot, kw_matplotlib = self._get_synced_params(key, value)
-                rc_matplotlib.update(kw_matplotlib)
-                rc_proplot.update(kw_proplot)
+            with timers._benchmark('defaults'):
+                rc_matplotlib.update(_get_style_dicts('original', filter=False))
+                rc_matplotlib.update(rcsetup._rc_matplotlib_default)
+                rc_proplot.update(rcsetup._rc_proplot_default)
+                kw_proplot, kw_matplotlib = self._get_synced_dicts(rc_proplot)
+                self._update_params(kw_proplot, kw_matplotlib)
 
         # Update from user home
         user_path = None
@@ -894,9 +1507,9 @@ class RcConfigurator(object):
         path : str
             The file path.
         """
-        kw_proplot, kw_matplotlib = self._load_file(path)
-        rc_proplot.update(kw_proplot)
-        rc_matplotlib.update(kw_matplotlib)
+        with timers._benchmark(f'load {path}'):
+            kw_proplot, kw_matplotlib = self._load_file(path)
+        self._update_params(kw_proplot, kw_matplotlib)
 
     @staticmethod
     def _save_rst(path):
@@ -1247,7 +1860,7 @@ def use_style(style):
 
 
 @docstring.add_snippets
-def register_cmaps(user=True, default=False):
+def register_cmaps(user=True, default=False, watch=None):
     """
     Register colormaps packaged with ProPlot or saved to the
     ``~/.proplot/cmaps`` folder. This is called on import.
@@ -1261,21 +1874,20 @@ def register_cmaps(user=True, default=False):
     Parameters
     ----------
     %(register_cmaps.params)s
+    %(register.watch)s
     """
-    for i, dirname, filename in _iter_data_paths('cmaps', user=user, default=default):
-        path = os.path.join(dirname, filename)
-        cmap = pcolors.LinearSegmentedColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
-            continue
-        if i == 0 and cmap.name.lower() in (
-            'phase', 'graycycle', 'romao', 'broco', 'corko', 'viko',
-        ):
-            cmap.set_cyclic(True)
-        pcolors._cmap_database[cmap.name] = cmap
+    args = ('cmaps', pcolors.LinearSegmentedColormap)
+    kwargs = {
+        'cyclic': ('phase', 'graycycle', 'romao', 'broco', 'corko', 'viko'),
+        'user': user,
+        'default': default,
+    }
+    _register_cmap_files(*args, **kwargs)
+    _watch_cmap_files(watch, *args, **kwargs)
 
 
 @docstring.add_snippets
-def register_cycles(user=True, default=False):
+def register_cycles(user=True, default=False, watch=None):
     """
     Register color cycles packaged with ProPlot or saved to the
     ``~/.proplot/cycles`` folder. This is called on import. Color cycles
@@ -1289,13 +1901,151 @@ def register_cycles(user=True, default=False):
     Parameters
     ----------
     %(register_cycles.params)s
+    %(register.watch)s
     """
-    for _, dirname, filename in _iter_data_paths('cycles', user=user, default=default):
-        path = os.path.join(dirname, filename)
-        cmap = pcolors.ListedColormap.from_file(path, warn_on_failure=True)
-        if not cmap:
+    args = ('cycles', pcolors.ListedColormap)
+    kwargs = {'user': user, 'default': default}
+    _register_cmap_files(*args, **kwargs)
+    _watch_cmap_files(watch, *args, **kwargs)
+
+
+def _read_color_file(path, skip=()):
+    """
+    Read the color file and return a dictionary of the color names and hex
+    strings. Color names in `skip` are ignored.
+    """
+    loaded = {}
+    hex = re.compile(rf'\A{pcolors.HEX_PATTERN}\Z')  # match each string
+    with timers._benchmark(f'load {path}'), open(path, 'r') as fh:
+        for cnt, line in enumerate(fh):
+            # Load colors from file
+            stripped = line.strip()
+            if not stripped or stripped[0] == '#':
+                continue
+            pair = tuple(
+                item.strip().lower() for item in line.split(':')
+            )
+            if len(pair) != 2 or not hex.match(pair[1]):
+                warnings._warn_proplot(
+                    f'Illegal line #{cnt + 1} in file {path!r}:\n'
+                    f'{line!r}\n'
+                    f'Lines must be formatted as "name: hexcolor".'
+                )
+                continue
+            name, color = pair
+            if name in skip:
+                continue
+            loaded[name] = color
+    return loaded
+
+
+def _get_distinct_colors(loaded, space='hcl', margin=0.10):
+    """
+    Return the subset of XKCD colors that are "perceptually distinct".
+    """
+    # Always add these colors, but make sure not to add other
+    # colors too close to them.
+    loaded = loaded.copy()
+    filtered = []
+    for name in ALWAYS_ADD:
+        color = loaded.pop(name, None)
+        if color is None:
+            continue
+        if 'grey' in name:
+            name = name.replace('grey', 'gray')
+        filtered.append((name, color))
+    nalways = len(filtered)
+
+    # Get locations of "perceptually distinct" colors
+    # WARNING: Unique axis argument requires numpy version >=1.13
+    for name, color in loaded.items():
+        for string, replace in TRANSLATE_COLORS:
+            if string in name:
+                name = name.replace(string, replace)
+        if any(string in name for string in ALWAYS_REMOVE):
+            continue  # remove "unpofessional" names
+        filtered.append((name, color))  # category name pair
+    if not filtered:
+        return {}
+    rgbs = _hex_to_rgb_array([color for _, color in filtered])
+    hcls = _to_xyz_array(rgbs, space=space)
+    hcls = hcls / np.array([360, 100, 100])
+    hcls = np.round(hcls / margin).astype(np.int64)
+    _, idxs = np.unique(hcls, return_index=True, axis=0)
+
+    # Return "distinct" colors
+    distinct = dict(filtered[:nalways])
+    distinct.update(filtered[idx] for idx in idxs)
+    return distinct
+
+
+def _save_distinct_colors():
+    """
+    Save the "perceptually distinct" XKCD colors for the default `space` and
+    `margin` used by `register_colors`. Should be re-run whenever the XKCD color
+    table or the filtering settings are changed.
+    """
+    path = os.path.join(os.path.dirname(__file__), 'colors', 'xkcd.txt')
+    distinct = _get_distinct_colors(_read_color_file(path, BASE_COLORS))
+    with open(_xkcd_distinct_file, 'w') as fh:
+        fh.write(
+            '# Perceptually distinct subset of the XKCD color survey colors for\n'
+            "# space='hcl' and margin=0.10. Generated from xkcd.txt with\n"
+            '# proplot.config._save_distinct_colors().\n'
+        )
+        for name, color in distinct.items():
+            fh.write(f'{name}: {color}\n')
+
+
+def _load_color_files(paths, space='hcl', margin=0.10):
+    """
+    Parse the color files and return dictionaries of the colors to be added to
+    the color database, the open-color colors, and the XKCD colors.
+    """
+    # Load colors from file and get their HCL values
+    # NOTE: Colors that come *later* overwrite colors that come earlier.
+    # NOTE: The "perceptually distinct" XKCD colors for the default space and
+    # margin are precomputed and shipped with proplot.
+    colors, open_colors, xkcd_colors = {}, {}, {}
+    for i, path in paths:
+        cat, ext = os.path.splitext(os.path.basename(path))
+        if ext != '.txt':
+            raise ValueError(
+                f'Unknown color data file extension ({path!r}). '
+                'All files in this folder should have extension .txt.'
+            )
+        if path == _xkcd_distinct_file:
             continue
-        pcolors._cmap_database[cmap.name] = cmap
+
+        # Add every user color and every opencolor color and ensure XKCD
+        # colors are "perceptually distinct". Never overwrite "base" colors
+        # with xkcd colors. Only overwrite with user colors.
+        skip = BASE_COLORS if i == 0 else ()
+        if i == 1:
+            colors.update(_read_color_file(path, skip))
+        elif cat == 'opencolor':
+            loaded = _read_color_file(path, skip)
+            colors.update(loaded)
+            open_colors.update(loaded)
+        elif cat == 'xkcd':
+            if (
+                space == 'hcl' and margin == 0.10
+                and os.path.dirname(path) == os.path.dirname(_xkcd_distinct_file)
+                and os.path.isfile(_xkcd_distinct_file)
+            ):
+                distinct = _read_color_file(_xkcd_distinct_file)
+            else:
+                loaded = _read_color_file(path, skip)
+                with timers._benchmark('distinct colors'):
+                    distinct = _get_distinct_colors(
+                        loaded, space=space, margin=margin
+                    )
+            colors.update(distinct)
+            xkcd_colors.update(distinct)
+        else:
+            raise ValueError(f'Unknown proplot color database {path!r}.')
+
+    return colors, open_colors, xkcd_colors
 
 
 @docstring.add_snippets
@@ -1329,90 +2079,107 @@ def register_colors(user=True, default=False, space='hcl', margin=0.10):
     for name, dict_ in (('base', BASE_COLORS), ('css', mcolors.CSS4_COLORS)):
         mcolors.colorConverter.colors.update(dict_)
 
-    # Load colors from file and get their HCL values
-    # NOTE: Colors that come *later* overwrite colors that come earlier.
-    hex = re.compile(rf'\A{pcolors.HEX_PATTERN}\Z')  # match each string
-    for i, dirname, filename in _iter_data_paths('colors', user=user, default=default):
-        path = os.path.join(dirname, filename)
-        cat, ext = os.path.splitext(filename)
-        if ext != '.txt':
-            raise ValueError(
-                f'Unknown color data file extension ({path!r}). '
-                'All files in this folder should have extension .txt.'
-            )
+    # Load colors from the registry cache or from file
+    paths = [
+        (i, os.path.join(dirname, filename))
+        for i, dirname, filename
+        in _iter_data_paths('colors', user=user, default=default)
+    ]
+    key = ('colors', user, default, space, margin)
+    stamp = tuple((path, _get_file_stamp(path)) for _, path in paths)
+    loaded = _registry_cache.get(key, stamp)
+    if loaded is None:
+        loaded = _load_color_files(paths, space=space, margin=margin)
+        _registry_cache.set(key, stamp, loaded)
+        _registry_cache.save()
+    colors, open_colors, xkcd_colors = loaded
+    mcolors.colorConverter.colors.update(colors)
+    OPEN_COLORS.update(open_colors)
+    XKCD_COLORS.update(xkcd_colors)
+
+
+def _get_font_stamp(paths):
+    """
+    Return the modification times of the folders, the names, sizes, and
+    modification times of the font files in the folders, and the stamp of the
+    matplotlib font cache. Return ``None`` if the font cache location is unknown.
+    """
+    cache = getattr(mfonts, '_fmcache', None)
+    if not cache or not os.path.isfile(cache):
+        return
+    dirs, files = [], []
+    for path in paths:
+        for dirname, _, filenames in os.walk(path):
+            dirs.append([dirname, os.stat(dirname).st_mtime_ns])
+            for filename in sorted(filenames):
+                file = os.path.join(dirname, filename)
+                files.append([file, *_get_file_stamp(file)])
+    return {'dirs': dirs, 'files': files, 'cache': [cache, *_get_file_stamp(cache)]}
 
-        # Read data
-        loaded = {}
-        with open(path, 'r') as fh:
-            for cnt, line in enumerate(fh):
-                # Load colors from file
-                stripped = line.strip()
-                if not stripped or stripped[0] == '#':
-                    continue
-                pair = tuple(
-                    item.strip().lower() for item in line.split(':')
-                )
-                if len(pair) != 2 or not hex.match(pair[1]):
-                    warnings._warn_proplot(
-                        f'Illegal line #{cnt + 1} in file {path!r}:\n'
-                        f'{line!r}\n'
-                        f'Lines must be formatted as "name: hexcolor".'
-                    )
-                    continue
-                # Never overwrite "base" colors with xkcd colors.
-                # Only overwrite with user colors.
-                name, color = pair
-                if i == 0 and name in BASE_COLORS:
-                    continue
-                loaded[name] = color
 
-        # Add every user color and every opencolor color and ensure XKCD
-        # colors are "perceptually distinct".
-        if i == 1:
-            mcolors.colorConverter.colors.update(loaded)
-        elif cat == 'opencolor':
-            mcolors.colorConverter.colors.update(loaded)
-            OPEN_COLORS.update(loaded)
-        elif cat == 'xkcd':
-            # Always add these colors, but make sure not to add other
-            # colors too close to them.
-            hcls = []
-            filtered = []
-            for name in ALWAYS_ADD:
-                color = loaded.pop(name, None)
-                if color is None:
-                    continue
-                if 'grey' in name:
-                    name = name.replace('grey', 'gray')
-                hcls.append(to_xyz(color, space=space))
-                filtered.append((name, color))
-                mcolors.colorConverter.colors[name] = color
-                XKCD_COLORS[name] = color
-
-            # Get locations of "perceptually distinct" colors
-            # WARNING: Unique axis argument requires numpy version >=1.13
-            for name, color in loaded.items():
-                for string, replace in TRANSLATE_COLORS:
-                    if string in name:
-                        name = name.replace(string, replace)
-                if any(string in name for string in ALWAYS_REMOVE):
-                    continue  # remove "unpofessional" names
-                hcls.append(to_xyz(color, space=space))
-                filtered.append((name, color))  # category name pair
-            hcls = np.asarray(hcls)
-            if not hcls.size:
-                continue
-            hcls = hcls / np.array([360, 100, 100])
-            hcls = np.round(hcls / margin).astype(np.int64)
-            _, idxs = np.unique(hcls, return_index=True, axis=0)
-
-            # Register "distinct" colors
-            for idx in idxs:
-                name, color = filtered[idx]
-                mcolors.colorConverter.colors[name] = color
-                XKCD_COLORS[name] = color
-        else:
-            raise ValueError(f'Unknown proplot color database {path!r}.')
+def _check_font_stamp(paths, stamp):
+    """
+    Return whether the folders and the matplotlib font cache are unchanged since
+    the stamp was saved without walking the folders.
+    """
+    # NOTE: Folder modification times change when files are added, removed, or
+    # renamed, but not when existing files are overwritten in-place.
+    cache = getattr(mfonts, '_fmcache', None)
+    if not cache or not isinstance(stamp, dict):
+        return False
+    try:
+        dirs = dict(stamp['dirs'])
+        if stamp['cache'] != [cache, *_get_file_stamp(cache)]:
+            return False
+        if any(path not in dirs for path in paths if os.path.isdir(path)):
+            return False
+        for dirname, mtime in dirs.items():
+            if os.stat(dirname).st_mtime_ns != mtime:
+                return False
+    except (KeyError, TypeError, ValueError, OSError):
+        return False
+    return True
+
+
+def _get_font_stamp_path():
+    """
+    Return the path of the file used to store the font stamp.
+    """
+    cache = getattr(mfonts, '_fmcache', None)
+    if cache:
+        return os.path.join(os.path.dirname(cache), 'proplot-fonts.json')
+
+
+def _save_font_stamp(stamp):
+    """
+    Save the font stamp unless proplot is in read-only mode.
+    """
+    stamp_path = _get_font_stamp_path()
+    if stamp is None or stamp_path is None or _readonly:
+        return
+    try:
+        with open(stamp_path + '.tmp', 'w') as fh:
+            json.dump(stamp, fh)
+        os.replace(stamp_path + '.tmp', stamp_path)
+    except OSError:
+        pass
+
+
+def _filter_fonts():
+    """
+    Remove ttc files and 'Thin' fonts from the font manager font list.
+    """
+    # NOTE: 'Thin' filter is ugly kludge but without this matplotlib picks up on
+    # Roboto thin ttf files installed on the RTD server when compiling docs.
+    global _fonts_filtered
+    if _fonts_filtered is mfonts.fontManager:
+        return
+    mfonts.fontManager.ttflist = [
+        font for font in mfonts.fontManager.ttflist
+        if os.path.splitext(font.fname)[1] != '.ttc'
+        or 'Thin' in os.path.basename(font.fname)
+    ]
+    _fonts_filtered = mfonts.fontManager
 
 
 def register_fonts():
@@ -1426,6 +2193,29 @@ def register_fonts():
 
     To visualize the registered fonts, use `~proplot.demos.show_fonts`.
     """
+    # Skip font discovery if the font files and the matplotlib font cache are
+    # unchanged since the last time fonts were registered. Only walk the folders
+    # if the cheap check of the folder modification times fails.
+    # NOTE: Fonts are added to the matplotlib font cache, so if the cache is
+    # unchanged it must already contain the proplot fonts.
+    paths_proplot = _get_data_paths('fonts', reverse=True)
+    stamp_path = _get_font_stamp_path()
+    try:
+        with open(stamp_path, 'r') as fh:
+            stamp_cached = json.load(fh)
+    except (TypeError, OSError, ValueError):
+        stamp_cached = None
+    if _check_font_stamp(paths_proplot, stamp_cached):
+        _filter_fonts()  # cheap compared to font discovery
+        return
+    stamp = _get_font_stamp(paths_proplot)
+    if stamp is not None and isinstance(stamp_cached, dict) and all(
+        stamp[key] == stamp_cached.get(key) for key in ('files', 'cache')
+    ):
+        _save_font_stamp(stamp)  # update the folder modification times
+        _filter_fonts()
+        return
+
     # Find proplot fonts
     # WARNING: If you include a font file with an unrecognized style,
     # matplotlib may use that font instead of the 'normal' one! Valid styles:
@@ -1434,8 +2224,8 @@ def register_fonts():
     # https://matplotlib.org/api/font_manager_api.html
     # For macOS the only fonts with 'Thin' in one of the .ttf file names
     # are Helvetica Neue and .SF NS Display Condensed. Never try to use these!
-    paths_proplot = _get_data_paths('fonts', reverse=True)
-    fnames_proplot = set(mfonts.findSystemFonts(paths_proplot))
+    with timers._benchmark('find fonts'):
+        fnames_proplot = set(mfonts.findSystemFonts(paths_proplot))
 
     # Detect user-input ttc fonts and issue warning
     fnames_proplot_ttc = {
@@ -1454,32 +2244,35 @@ def register_fonts():
     fnames_proplot -= fnames_proplot_ttc
     if not fnames_all >= fnames_proplot:
         warnings._warn_proplot('Rebuilding font cache.')
-        if hasattr(mfonts.fontManager, 'addfont'):
-            # New API lets us add font files manually
-            for fname in fnames_proplot:
-                mfonts.fontManager.addfont(fname)
-            mfonts.json_dump(mfonts.fontManager, mfonts._fmcache)
-        else:
-            # Old API requires us to modify TTFPATH
-            # NOTE: Previously we tried to modify TTFPATH before importing
-            # font manager with hope that it would load proplot fonts on
-            # initialization. But 99% of the time font manager just imports
-            # the FontManager from cache, so this doesn't work.
-            paths = ':'.join(paths_proplot)
-            if 'TTFPATH' not in os.environ:
-                os.environ['TTFPATH'] = paths
-            elif paths not in os.environ['TTFPATH']:
-                os.environ['TTFPATH'] += ':' + paths
-            mfonts._rebuild()
+        with timers._benchmark('rebuild font cache'):
+            if hasattr(mfonts.fontManager, 'addfont'):
+                # New API lets us add font files manually
+                for fname in fnames_proplot:
+                    mfonts.fontManager.addfont(fname)
+                if not _readonly:
+                    mfonts.json_dump(mfonts.fontManager, mfonts._fmcache)
+            else:
+                # Old API requires us to modify TTFPATH
+                # NOTE: Previously we tried to modify TTFPATH before importing
+                # font manager with hope that it would load proplot fonts on
+                # initialization. But 99% of the time font manager just imports
+                # the FontManager from cache, so this doesn't work.
+                paths = ':'.join(paths_proplot)
+                if 'TTFPATH' not in os.environ:
+                    os.environ['TTFPATH'] = paths
+                elif paths not in os.environ['TTFPATH']:
+                    os.environ['TTFPATH'] += ':' + paths
+                if _readonly:  # _rebuild() also writes the cache file
+                    mfonts.fontManager = mfonts.FontManager()
+                else:
+                    mfonts._rebuild()
 
     # Remove ttc files and 'Thin' fonts *after* rebuild
-    # NOTE: 'Thin' filter is ugly kludge but without this matplotlib picks up on
-    # Roboto thin ttf files installed on the RTD server when compiling docs.
-    mfonts.fontManager.ttflist = [
-        font for font in mfonts.fontManager.ttflist
-        if os.path.splitext(font.fname)[1] != '.ttc'
-        or 'Thin' in os.path.basename(font.fname)
-    ]
+    _filter_fonts()
+
+    # Save the stamp after the font cache was updated
+    stamp = _get_font_stamp(paths_proplot)
+    _save_font_stamp(stamp)
 
 
 def _patch_validators():
@@ -1526,19 +2319,26 @@ def _patch_validators():
                 validate[key] = _validate_fontsizelist
 
 
-# Initialize .proplotrc file
+# Initialize .proplotrc file and customization folders
+# NOTE: Nothing is written to the home directory in read-only mode. This is
+# selected with the PROPLOT_READONLY environment variable.
 _user_rc_file = os.path.join(os.path.expanduser('~'), '.proplotrc')
-if not os.path.exists(_user_rc_file):
-    RcConfigurator._save_proplotrc(_user_rc_file, comment=True)
-
-# Initialize customization folders
 _rc_folder = os.path.join(os.path.expanduser('~'), '.proplot')
-if not os.path.isdir(_rc_folder):
-    os.mkdir(_rc_folder)
-for _rc_sub in ('cmaps', 'cycles', 'colors', 'fonts'):
-    _rc_sub = os.path.join(_rc_folder, _rc_sub)
-    if not os.path.isdir(_rc_sub):
-        os.mkdir(_rc_sub)
+if not _readonly:
+    if not os.path.exists(_user_rc_file):
+        RcConfigurator._save_proplotrc(_user_rc_file, comment=True)
+    if not os.path.isdir(_rc_folder):
+        os.mkdir(_rc_folder)
+    for _rc_sub in ('cmaps', 'cycles', 'colors', 'fonts'):
+        _rc_sub = os.path.join(_rc_folder, _rc_sub)
+        if not os.path.isdir(_rc_sub):
+            os.mkdir(_rc_sub)
+
+# Initialize cache of parsed data files
+# NOTE: Colormap and cycle files are loaded on first use so the cache
+# is updated throughout the session and written on exit.
+_registry_cache = _RegistryCache(os.path.join(_rc_folder, '.registry.pkl'))
+atexit.register(_registry_cache.save)
 
 # Add custom font scalings to font_manager and monkey patch rcParams validator
 # NOTE: This is because we prefer large sizes
@@ -1579,8 +2379,10 @@ rc = _
 # Modify N of existing colormaps because ProPlot settings may have changed
 # image.lut. We have to register colormaps and cycles first so that the 'cycle'
 # property accepts named cycles registered by ProPlot. No performance hit here.
+# NOTE: Colormaps loaded lazily from files apply image.lut when they are loaded
+# (see _load_cmap_file) so skip them here rather than loading every file.
 lut = rc['image.lut']
-for cmap in pcolors._cmap_database.values():
+for cmap in dict.values(pcolors._cmap_database):
     if isinstance(cmap, mcolors.LinearSegmentedColormap):
         cmap.N = lut
 
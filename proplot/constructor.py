@@ -13,7 +13,9 @@ from simple shorthand arguments.
 # User should just inspect docstrings, use trial-error, or see online tables.
 import os
 import re
-from functools import partial
+import sys
+from collections import OrderedDict
+from functools import partial, wraps
 from numbers import Number
 
 import cycler
@@ -33,10 +35,6 @@ from .internals import ic  # noqa: F401
 from .internals import _not_none, _version, _version_cartopy, _version_mpl, warnings
 from .utils import to_rgba
 
-try:
-    from mpl_toolkits.basemap import Basemap
-except ImportError:
-    Basemap = object
 try:
     import cartopy.crs as ccrs
     import cartopy.mpl.ticker as cticker
@@ -330,28 +328,189 @@ BASEMAP_FEATURES = {  # names of relevant basemap methods
 }
 
 
+class _ConstructorCache(object):
+    """
+    Bounded least-recently-used cache of `Colormap` and `Cycle` results. Entries
+    are keyed on a hashable normalization of the arguments and are ignored if
+    the registered colormaps or files referenced by the arguments change.
+    """
+    def __init__(self, maxsize=128):
+        self._data = OrderedDict()
+        self.maxsize = maxsize
+
+    @classmethod
+    def _get_key(cls, value):
+        # NOTE: Colormap instances are keyed on their identity and state. The
+        # entry stores references to the arguments so that ids are not reused.
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, Number):
+            return (type(value).__name__, value)
+        if isinstance(value, mcolors.Colormap):
+            return ('cmap', id(value), pcolors._cmap_cache._get_state(value))
+        if isinstance(value, np.ndarray):
+            return ('array', value.dtype.str, value.shape, value.tobytes())
+        if isinstance(value, dict):
+            return ('dict', tuple(sorted(
+                (key, cls._get_key(val)) for key, val in value.items()
+            )))
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__, tuple(map(cls._get_key, value)))
+        raise TypeError(f'Unhashable argument {value!r}.')
+
+    @classmethod
+    def _iter_strings(cls, value):
+        # Strings nested inside the argument lists, tuples, and dictionaries
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            for val in value.values():
+                yield from cls._iter_strings(val)
+        elif isinstance(value, (list, tuple)):
+            for val in value:
+                yield from cls._iter_strings(val)
+
+    @staticmethod
+    def _get_color(key):
+        # Registered color values under the exact and lowercase names
+        colors = mcolors._colors_full_map
+        return (dict.get(colors, key, None), dict.get(colors, key.lower(), None))
+
+    @classmethod
+    def _get_depends(cls, args, kwargs):
+        # Registered colormaps, colors, and files referenced by string arguments
+        # NOTE: The output name is skipped because it is registered by the call.
+        depends = []
+        database = pcolors._cmap_database
+        kwargs = {key: val for key, val in kwargs.items() if key != 'name'}
+        for arg in {*cls._iter_strings(args), *cls._iter_strings(kwargs)}:
+            if '.' in arg and os.path.isfile(arg):
+                stat = os.stat(arg)
+                depends.append(('file', arg, (stat.st_mtime_ns, stat.st_size)))
+                continue
+            depends.append(('color', arg, cls._get_color(arg)))
+            try:
+                key, *_ = database._parse_key(arg)
+            except KeyError:  # could be registered later
+                key = database._sanitize_key(arg, mirror=True)
+                key = re.sub(r'(_r)?(_s)?\Z', '', key)
+            value = dict.get(database, key, None)
+            if isinstance(value, pcolors._LazyColormap):
+                database.get(key)  # load the colormap
+                value = dict.get(database, key, None)
+            if isinstance(value, mcolors.Colormap):
+                state = pcolors._cmap_cache._get_state(value)
+            else:
+                state = None
+            depends.append(('cmap', key, value, state))
+        return tuple(depends)
+
+    @classmethod
+    def _check_depends(cls, depends):
+        database = pcolors._cmap_database
+        for kind, key, *state in depends:
+            if kind == 'file':
+                try:
+                    stat = os.stat(key)
+                except OSError:
+                    return False
+                if state[0] != (stat.st_mtime_ns, stat.st_size):
+                    return False
+            elif kind == 'color':
+                if state[0] != cls._get_color(key):
+                    return False
+            else:
+                value, state = state
+                if dict.get(database, key, None) is not value:
+                    return False
+                get_state = pcolors._cmap_cache._get_state
+                if state is not None and state != get_state(value):
+                    return False
+        return True
+
+    def clear(self):
+        """
+        Clear the cache.
+        """
+        self._data.clear()
+
+    def call(self, func, args, kwargs):
+        """
+        Return the cached result of calling the function with the
+        arguments or call the function and cache the result.
+        """
+        # NOTE: The property cycle and lookup table size are included in the
+        # key because they are used to interpret colors and build colormaps.
+        try:
+            props = rc['axes.prop_cycle'].by_key()
+            key = (
+                func.__name__, rc['image.lut'],
+                self._get_key(tuple(props.get('color', ()))),
+                self._get_key(args), self._get_key(kwargs),
+            )
+            hash(key)
+        except TypeError:  # unhashable arguments
+            return func(*args, **kwargs)
+        entry = self._data.get(key, None)
+        if entry is not None and self._check_depends(entry[2]):
+            self._data.move_to_end(key)
+            return entry[3]
+        depends = self._get_depends(args, kwargs)
+        value = func(*args, **kwargs)
+        self._data[key] = (args, kwargs, depends, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+
+def _cache_constructor(func):
+    """
+    Support the optional `cache` keyword argument for `Colormap` and `Cycle`.
+    """
+    @wraps(func)
+    def wrapper(*args, cache=False, **kwargs):
+        if not cache or kwargs.get('save', False):
+            return func(*args, **kwargs)
+        value = _constructor_cache.call(func, args, kwargs)
+        if isinstance(value, mcolors.Colormap):  # register again if overwritten
+            database = pcolors._cmap_database
+            key = database._sanitize_key(value.name, mirror=False)
+            if dict.get(database, key, None) is not value:
+                database[value.name] = value
+        return value
+    return wrapper
+
+
 def _mod_colormap(cmap, *, cut, left, right, shift, reverse, samples):
     """
-    Modify colormap in a variety of ways.
+    Modify colormap in a variety of ways. The modified colormaps are cached.
     """
+    cache = pcolors._cmap_cache
+    transform = cache._transform  # copied below
+    cmap_input = cmap
     if cut is not None or left is not None or right is not None:
         if isinstance(cmap, pcolors.ListedColormap):
             if cut is not None:
                 warnings._warn_proplot(
                     "Invalid argument 'cut' for ListedColormap. Ignoring."
                 )
-            cmap = cmap.truncate(left=left, right=right)
+            cmap = transform(cmap, 'truncate', left=left, right=right)
         else:
-            cmap = cmap.cut(cut, left=left, right=right)
+            cmap = transform(cmap, 'cut', cut, left=left, right=right)
     if shift is not None:
-        cmap = cmap.shifted(shift)
+        cmap = transform(cmap, 'shifted', shift)
     if reverse:
-        cmap = cmap.reversed()
+        cmap = transform(cmap, 'reversed')
     if samples is not None:
+        if np.iterable(samples):
+            samples = tuple(samples)
         if isinstance(cmap, pcolors.ListedColormap):
-            cmap = cmap.copy(N=samples)
+            cmap = transform(cmap, 'copy', N=samples)
         else:
-            cmap = cmap.to_listed(samples)
+            cmap = transform(cmap, 'to_listed', samples)
+    if cmap is not cmap_input:
+        cmap = cache.copy(cmap)
     return cmap
 
 
@@ -364,6 +523,7 @@ def Colors(*args, **kwargs):
     return [dict_['color'] for dict_ in cycle]
 
 
+@_cache_constructor
 def Colormap(
     *args, name=None, listmode='perceptual',
     samples=None, cut=None, left=None, right=None, reverse=False, shift=None,
@@ -470,6 +630,13 @@ def Colormap(
         Ignored if `save` is ``False``. Passed to the colormap/color cycle
         save method, i.e. `proplot.colors.LinearSegmentedColormap.save` or
         `proplot.colors.ListedColormap.save`.
+    cache : bool, optional
+        Whether to return the colormap generated by a previous call with the
+        same arguments. Default is ``False``. Previous results are ignored if
+        the registered colormaps, colors, or files named by the arguments (including
+        names nested inside lists, tuples, and dictionaries) have changed, and
+        are never used if `save` is ``True``. Note the same colormap instance
+        is returned by each call.
 
     Other parameters
     ----------------
@@ -604,15 +771,18 @@ def Colormap(
         shift=shift, reverse=reverse, samples=samples
     )
 
-    # Initialize
-    if not cmap._isinit:
-        cmap._init()
-
-    # Register and save the colormap
+    # Rename the colormap
+    # NOTE: Copy rather than rename the colormap since it may be shared with the
+    # colormap database or the cache of transformed colormaps.
     if name is None:
         name = cmap.name  # may have been modified by e.g. .shifted()
-    else:
-        cmap.name = name
+    elif name != cmap.name:
+        if isinstance(cmap, (pcolors.LinearSegmentedColormap, pcolors.ListedColormap)):
+            cmap = cmap.copy(name=name)
+        else:
+            cmap.name = name
+
+    # Register and save the colormap
     pcolors._cmap_database[name] = cmap
     if save:
         save_kw = save_kw or {}
@@ -620,6 +790,7 @@ def Colormap(
     return cmap
 
 
+@_cache_constructor
 def Cycle(
     *args, N=None, samples=None, name=None,
     marker=None, alpha=None, dashes=None, linestyle=None, linewidth=None,
@@ -678,6 +849,9 @@ def Cycle(
 <https://matplotlib.org/3.1.0/gallery/lines_bars_and_markers/marker_reference.html>`__,
         and the `custom dashes reference \
 <https://matplotlib.org/3.1.0/gallery/lines_bars_and_markers/line_demo_dash_control.html>`__.
+    cache : bool, optional
+        Whether to return the cycler generated by a previous call with the
+        same arguments. Default is ``False``. See `Colormap` for details.
 
     Other parameters
     ----------------
@@ -771,6 +945,10 @@ def Cycle(
     return cycle
 
 
+# Cache of colormaps and cycles
+_constructor_cache = _ConstructorCache()
+
+
 def Norm(norm, *args, **kwargs):
     """
     Return an arbitrary `~matplotlib.colors.Normalize` instance. Used to
@@ -1337,7 +1515,9 @@ def Proj(name, basemap=None, **kwargs):
     """  # noqa
     # Class instances
     is_crs = CRS is not object and isinstance(name, CRS)
-    is_basemap = Basemap is not object and isinstance(name, Basemap)
+    # NOTE: Basemap is slow to import. Instances can only exist if it was imported.
+    mbasemap = sys.modules.get('mpl_toolkits.basemap', None)
+    is_basemap = mbasemap is not None and isinstance(name, mbasemap.Basemap)
     if is_crs or is_basemap:
         proj = name
         proj._proj_package = 'cartopy' if is_crs else 'basemap'
@@ -11,7 +11,14 @@ import numpy as np
 
 from . import colors as pcolors
 from . import constructor, ui
-from .config import BASE_COLORS, OPEN_COLORS, XKCD_COLORS, _get_data_paths, rc
+from .config import (
+    BASE_COLORS,
+    OPEN_COLORS,
+    XKCD_COLORS,
+    _filter_fonts,
+    _get_data_paths,
+    rc,
+)
 from .internals import ic  # noqa: F401
 from .internals import _not_none, docstring
 from .utils import to_rgb, to_xyz
@@ -784,6 +791,7 @@ def show_fonts(
     stretch : stretch-spec, optional
         The font stretch.
     """
+    _filter_fonts()  # normally done on the first font lookup
     if not args and family is None:
         # User fonts and sans-serif fonts. Note all proplot sans-serif fonts
         # are added to 'font.sans-serif' by default
@@ -26,6 +26,10 @@ Provided by this module:
 * `rgb_to_hsluv`
 * `hpluv_to_rgb`
 * `rgb_to_hpluv`
+
+The above functions also have "array" variants suffixed with ``_array``
+(e.g. `hcl_to_rgb_array`) that accept and return arrays of shape ``(..., 3)``
+and convert every color in one vectorized pass.
 """
 # Imports (below functions are just meant to be used by user)
 # See: https://stackoverflow.com/a/2353265/4970632
@@ -33,6 +37,8 @@ Provided by this module:
 import math
 from colorsys import hls_to_rgb, rgb_to_hls
 
+import numpy as np
+
 # Coefficients or something
 m = [
     [3.2406, -1.5372, -0.4986],
@@ -341,3 +347,256 @@ def CIEluv_to_CIExyz(triple):
     X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
     Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
     return [X, Y, Z]
+
+
+# Vectorized variants of the above functions. These accept arrays of
+# shape (..., 3) and convert all colors at once.
+# NOTE: Special cases handled with if-else statements in the scalar functions
+# are handled with np.where below. Invalid intermediate values are
+# discarded, so we suppress the divide-by-zero warnings.
+def _split(array):
+    array = np.asarray(array, dtype=float)
+    if array.shape[-1:] != (3,):
+        raise ValueError(f'Expected array with shape (..., 3), got {array.shape}.')
+    return array[..., 0], array[..., 1], array[..., 2]
+
+
+def _stack(*channels):
+    return np.stack(np.broadcast_arrays(*channels), axis=-1)
+
+
+def hsluv_to_rgb_array(hsl):
+    return lchuv_to_rgb_array(hsluv_to_lchuv_array(hsl))
+
+
+def rgb_to_hsluv_array(rgb):
+    return lchuv_to_hsluv_array(rgb_to_lchuv_array(rgb))
+
+
+def hpluv_to_rgb_array(hsl):
+    return lchuv_to_rgb_array(hpluv_to_lchuv_array(hsl))
+
+
+def rgb_to_hpluv_array(rgb):
+    return lchuv_to_hpluv_array(rgb_to_lchuv_array(rgb))
+
+
+def lchuv_to_rgb_array(lch):
+    return CIExyz_to_rgb_array(CIEluv_to_CIExyz_array(lchuv_to_CIEluv_array(lch)))
+
+
+def rgb_to_lchuv_array(rgb):
+    return CIEluv_to_lchuv_array(CIExyz_to_CIEluv_array(rgb_to_CIExyz_array(rgb)))
+
+
+def hsl_to_rgb_array(hsl):
+    # See colorsys.hls_to_rgb
+    h, s, l = _split(hsl)
+    h, s, l = h / 360.0, s / 100.0, l / 100.0
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - l * s)
+    m1 = 2.0 * l - m2
+
+    def _v(hue):
+        hue = hue % 1.0
+        return np.select(
+            (hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0),
+            (m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0),
+            m1,
+        )
+
+    return _stack(_v(h + 1.0 / 3.0), _v(h), _v(h - 1.0 / 3.0))
+
+
+def rgb_to_hsl_array(rgb):
+    # See colorsys.rgb_to_hls
+    r, g, b = _split(rgb)
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    gray = minc == maxc
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - sumc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        h = np.select((r == maxc, g == maxc), (bc - gc, 2.0 + rc - bc), 4.0 + gc - rc)
+        h = (h / 6.0) % 1.0
+    h = np.where(gray, 0.0, h)
+    s = np.where(gray, 0.0, s)
+    return _stack(h * 360.0, s * 100.0, l * 100.0)
+
+
+def hcl_to_rgb_array(hcl):
+    h, c, l = _split(hcl)
+    return lchuv_to_rgb_array(_stack(l, c, h))
+
+
+def rgb_to_hcl_array(rgb):
+    l, c, h = _split(rgb_to_lchuv_array(rgb))
+    return _stack(h, c, l)
+
+
+def max_chroma_array(L, H):
+    L, H = np.broadcast_arrays(np.asarray(L, dtype=float), np.asarray(H, dtype=float))
+    hrad = np.radians(H)
+    sinH = np.sin(hrad)
+    cosH = np.cos(hrad)
+    sub1 = (L + 16) ** 3.0 / 1560896.0
+    sub2 = np.where(sub1 > 0.008856, sub1, L / 903.3)
+    result = np.full(L.shape, np.inf)
+    for m1, m2, m3 in m:
+        top = (0.99915 * m1 + 1.05122 * m2 + 1.14460 * m3) * sub2
+        rbottom = 0.86330 * m3 - 0.17266 * m2
+        lbottom = 0.12949 * m3 - 0.38848 * m1
+        bottom = (rbottom * sinH + lbottom * cosH) * sub2
+        for t in (0.0, 1.0):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                C = L * (top - 1.05122 * t) / (bottom + 0.17266 * sinH * t)
+            result = np.where((C > 0.0) & (C < result), C, result)
+    return result
+
+
+def hrad_extremum_array(L):
+    L = np.asarray(L, dtype=float)
+    lhs = (L ** 3.0 + 48.0 * L ** 2.0 + 768.0 * L + 4096.0) / 1560896.0
+    rhs = 1107.0 / 125000.0
+    sub = np.where(lhs > rhs, lhs, 10.0 * L / 9033.0)
+    chroma = np.full(L.shape, np.inf)
+    result = np.zeros(L.shape)
+    for m1, m2, m3 in m:
+        for limit in (0.0, 1.0):
+            top = -3015466475.0 * m3 * sub + 603093295.0 * m2 * sub \
+                - 603093295.0 * limit
+            bottom = 1356959916.0 * m1 * sub - 452319972.0 * m3 * sub
+            hrad = np.arctan2(top, bottom)
+            if limit == 0.0:
+                hrad += math.pi
+            test = max_chroma_array(L, np.degrees(hrad))
+            mask = test < chroma
+            chroma = np.where(mask, test, chroma)
+            result = np.where(mask, hrad, result)
+    return result
+
+
+def max_chroma_pastel_array(L):
+    H = np.degrees(hrad_extremum_array(L))
+    return max_chroma_array(L, H)
+
+
+def _lchuv_from_saturation(H, S, L, mx):
+    with np.errstate(invalid='ignore'):
+        C = mx * S / 100.0
+    light = L > 99.9999999
+    dark = L < 0.00000001
+    L = np.where(light, 100.0, np.where(dark, 0.0, L))
+    C = np.where(light | dark, 0.0, C)
+    return _stack(L, C, H)
+
+
+def _saturation_from_lchuv(L, C, H, mx):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = 100.0 * C / mx
+    light = L > 99.9999999
+    dark = L < 0.00000001
+    L = np.where(light, 100.0, np.where(dark, 0.0, L))
+    S = np.where(light | dark, 0.0, S)
+    return _stack(H, S, L)
+
+
+def hsluv_to_lchuv_array(hsl):
+    H, S, L = _split(hsl)
+    return _lchuv_from_saturation(H, S, L, max_chroma_array(L, H))
+
+
+def lchuv_to_hsluv_array(lch):
+    L, C, H = _split(lch)
+    return _saturation_from_lchuv(L, C, H, max_chroma_array(L, H))
+
+
+def hpluv_to_lchuv_array(hsl):
+    H, S, L = _split(hsl)
+    return _lchuv_from_saturation(H, S, L, max_chroma_pastel_array(L))
+
+
+def lchuv_to_hpluv_array(lch):
+    L, C, H = _split(lch)
+    return _saturation_from_lchuv(L, C, H, max_chroma_pastel_array(L))
+
+
+def from_linear_array(c):
+    c = np.asarray(c, dtype=float)
+    high = 1.055 * np.maximum(c, 0.0031308) ** (1.0 / 2.4) - 0.055
+    return np.where(c <= 0.0031308, 12.92 * c, high)
+
+
+def to_linear_array(c):
+    c = np.asarray(c, dtype=float)
+    a = 0.055
+    high = ((np.maximum(c, 0.04045) + a) / (1.0 + a)) ** 2.4
+    return np.where(c > 0.04045, high, c / 12.92)
+
+
+def CIExyz_to_rgb_array(xyz):
+    xyz = np.asarray(xyz, dtype=float)
+    return from_linear_array(xyz @ np.array(m).T)
+
+
+def rgb_to_CIExyz_array(rgb):
+    rgb = np.asarray(rgb, dtype=float)
+    return to_linear_array(rgb) @ np.array(m_inv).T
+
+
+def CIEluv_to_lchuv_array(luv):
+    L, U, V = _split(luv)
+    C = np.hypot(U, V)
+    H = np.degrees(np.arctan2(V, U))
+    H = np.where(H < 0.0, 360.0 + H, H)
+    return _stack(L, C, H)
+
+
+def lchuv_to_CIEluv_array(lch):
+    L, C, H = _split(lch)
+    Hrad = np.radians(H)
+    return _stack(L, np.cos(Hrad) * C, np.sin(Hrad) * C)
+
+
+def CIEfunc_array(t):
+    t = np.asarray(t, dtype=float)
+    high = np.maximum(t, lab_e) ** (1.0 / gamma)
+    return np.where(t > lab_e, high, 7.787 * t + 16.0 / 116.0)
+
+
+def CIEfunc_inverse_array(t):
+    t = np.asarray(t, dtype=float)
+    return np.where(t ** 3.0 > lab_e, t ** gamma, (116.0 * t - 16.0) / lab_k)
+
+
+def CIExyz_to_CIEluv_array(xyz):
+    X, Y, Z = _split(xyz)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varU = (4.0 * X) / (X + (15.0 * Y) + (3.0 * Z))
+        varV = (9.0 * Y) / (X + (15.0 * Y) + (3.0 * Z))
+    L = 116.0 * CIEfunc_array(Y / refY) - 16.0
+    U = 13.0 * L * (varU - refU)
+    V = 13.0 * L * (varV - refV)
+    black = ((X == 0.0) & (Y == 0.0) & (Z == 0.0)) | (L == 0.0)
+    return _stack(
+        np.where(black, 0.0, L), np.where(black, 0.0, U), np.where(black, 0.0, V)
+    )
+
+
+def CIEluv_to_CIExyz_array(luv):
+    L, U, V = _split(luv)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        varY = CIEfunc_inverse_array((L + 16.0) / 116.0)
+        varU = U / (13.0 * L) + refU
+        varV = V / (13.0 * L) + refV
+        Y = varY * refY
+        X = 0.0 - (9.0 * Y * varU) / ((varU - 4.0) * varV - varU * varV)
+        Z = (9.0 * Y - (15.0 * varV * Y) - (varV * X)) / (3.0 * varV)
+    black = L == 0
+    return _stack(
+        np.where(black, 0.0, X), np.where(black, 0.0, Y), np.where(black, 0.0, Z)
+    )
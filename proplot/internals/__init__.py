@@ -117,6 +117,25 @@ class _version(list):
         super().__init__([major, minor])  # then use builtin python list sorting
 
 
+def _get_version(package):
+    """
+    Return the installed version string for the package or ``'unknown'``. Use
+    `importlib.metadata` when available since `pkg_resources` is slow to import.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # python < 3.8
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution(package).version
+        except pkg_resources.DistributionNotFound:
+            return 'unknown'
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
 _version_mpl = _version(matplotlib.__version__)
 if cartopy is None:
     _version_cartopy = [0, 0]
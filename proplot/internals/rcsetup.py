@@ -9,7 +9,7 @@ import cycler
 import numpy as np
 from matplotlib import rcParamsDefault as _rc_matplotlib_default_full
 
-from . import warnings
+from . import timers, warnings
 
 # Initial synced properties
 # NOTE: Important that LINEWIDTH is less than matplotlib default of 0.8.
@@ -293,6 +293,12 @@ _rc_proplot = {
         '`pandas.DataFrame`, and `xarray.DataArray` objects passed to '
         'plotting functions.'
     ),
+    'benchmark': (
+        timers.BENCHMARK,
+        'Whether to record the time spent on proplot tasks like loading colormap '
+        'files. See `proplot.internals.timers.report`. To record the tasks run '
+        'on import, set the ``PROPLOT_BENCHMARK`` environment variable instead.'
+    ),
 
     # Axes additions
     'alpha': (
@@ -1,10 +1,81 @@
 #!/usr/bin/env python3
 """
-Utilities for timing ProPlot performance.
+Utilities for timing ProPlot performance. Timing is enabled by setting the
+``PROPLOT_BENCHMARK`` environment variable before importing proplot or by
+changing :rcraw:`benchmark`. The results are returned by `report`.
 """
+import collections
+import os
+import threading
 import time
 
-BENCHMARK = False  # toggle this to turn on benchmarking
+BENCHMARK = os.environ.get('PROPLOT_BENCHMARK', '').lower() not in (
+    '', '0', 'false', 'no', 'off',
+)
+
+
+class Timing(object):
+    """
+    The time spent in a block of code and in each block nested inside of it.
+    """
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}(name={self.name!r}, time={self.time:.6f}, '
+            f'children=<{len(self.children)} timings>)'
+        )
+
+    def __str__(self):
+        return '\n'.join(self._format())
+
+    def __init__(self, name, time=0.0, children=None):
+        """
+        Parameters
+        ----------
+        name : str
+            The name of the block.
+        time : float, optional
+            The elapsed time in seconds.
+        children : list of `Timing`, optional
+            The timings for nested blocks in the order they were entered.
+        """
+        self.name = name
+        self.time = time
+        self.children = [] if children is None else children
+
+    def _format(self, indent=0):
+        lines = [' ' * indent + f'{self.name}: {self.time:.6f}s']
+        for child in self.children:
+            lines.extend(child._format(indent + 2))
+        return lines
+
+    def to_dict(self):
+        """
+        Return a nested dictionary with the keys ``'name'``, ``'time'``,
+        and ``'children'``.
+        """
+        return {
+            'name': self.name,
+            'time': self.time,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+
+# The top-level blocks from all threads. The oldest blocks are discarded once
+# the limit is reached so that timing long-running sessions uses bounded memory.
+_timings = collections.deque(maxlen=1000)
+
+# The blocks that are currently running in each thread
+_local = threading.local()
+
+
+def _get_stack():
+    """
+    Return the blocks that are currently running in this thread.
+    """
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
 
 
 class _benchmark(object):
@@ -13,11 +84,40 @@ class _benchmark(object):
     """
     def __init__(self, message):
         self.message = message
+        self.timing = None
 
     def __enter__(self):
         if BENCHMARK:
+            self.timing = Timing(self.message)
+            stack = _get_stack()
+            if stack:
+                stack[-1].children.append(self.timing)
+            else:
+                _timings.append(self.timing)
+            stack.append(self.timing)
             self.time = time.perf_counter()
 
     def __exit__(self, *args):  # noqa: U100
-        if BENCHMARK:
-            print(f'{self.message}: {time.perf_counter() - self.time}s')
+        if self.timing is not None:
+            self.timing.time = time.perf_counter() - self.time
+            stack = _get_stack()
+            if self.timing in stack:  # also remove unfinished nested blocks
+                del stack[stack.index(self.timing):]
+            self.timing = None
+
+
+def report():
+    """
+    Return a `Timing` whose children are the recorded top-level blocks
+    and whose time is their total time. Only the most recent 1000 top-level
+    blocks are kept. Blocks run in different threads are recorded separately.
+    """
+    children = list(_timings)
+    return Timing('total', sum(child.time for child in children), children)
+
+
+def reset():
+    """
+    Remove the recorded timings.
+    """
+    _timings.clear()
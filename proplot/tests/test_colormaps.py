@@ -0,0 +1,99 @@
+import matplotlib.cm as mcm
+import numpy as np
+import pytest
+
+import proplot as plot
+from proplot.colors import _cmap_database, _LazyColormap
+
+
+@pytest.mark.parametrize('get_cmap', [
+    lambda: _cmap_database['RdBu_r'],
+    lambda: _cmap_database['RdBu_s'],
+    lambda: plot.Colormap('RdBu_r'),
+    lambda: plot.Colormap('RdBu', reverse=True),
+    lambda: plot.Colormap('Blues', left=0.2),
+    lambda: plot.Colormap('Blues', left=0.2, reverse=True),
+    lambda: mcm.get_cmap('viridis_r'),
+])
+def test_transform_cache_copies(get_cmap):
+    """Tests that modifying a cached colormap does not affect later lookups."""
+    cmap = get_cmap()
+    lut = cmap(np.linspace(0, 1, 5))
+    cmap.set_under('red')
+    cmap.set_over('green')
+    cmap.set_bad('blue')
+    cmap._lut[:-3] = 0
+    other = get_cmap()
+    assert other is not cmap
+    assert other._rgba_under is None
+    assert other._rgba_over is None
+    assert other._rgba_bad == (0.0, 0.0, 0.0, 0.0)
+    assert np.allclose(other(np.linspace(0, 1, 5)), lut)
+
+
+@pytest.mark.parametrize('alias, name, reverse, shift', [
+    ('BuRd', 'RdBu', True, False),
+    ('BuRd_r', 'RdBu', False, False),
+    ('RdBu_r', 'RdBu', True, False),
+    ('grays', 'Greys', False, False),
+    ('grays_r', 'Greys', True, False),
+    ('Greys_r_s', 'Greys', True, True),
+    ('GREYS_S', 'Greys', False, True),
+])
+def test_alias_lookup(alias, name, reverse, shift):
+    """Tests that aliases return the transformed registered colormap."""
+    cmap = _cmap_database[name]
+    if reverse:
+        cmap = cmap.reversed()
+    if shift:
+        cmap = cmap.shifted(180)
+    x = np.linspace(0, 1, 11)
+    assert alias in _cmap_database
+    assert np.allclose(_cmap_database[alias](x), cmap(x))
+
+
+@pytest.mark.parametrize('alias', ['greys_s_r', 'notacmap', 'rdbu__r'])
+def test_alias_invalid(alias):
+    """Tests that invalid names are rejected."""
+    assert alias not in _cmap_database
+    with pytest.raises(KeyError):
+        _cmap_database[alias]
+
+
+def test_contains_lazy():
+    """Tests that membership tests do not load lazy colormaps."""
+    loaded = []
+    lazy = _LazyColormap('lazy.rgb', loaded.append)
+    _cmap_database['_test_lazy'] = lazy
+    try:
+        assert '_test_lazy' in _cmap_database
+        assert '_TEST_LAZY_r' in _cmap_database
+        assert '_test_lazy_r_s' in _cmap_database
+        assert not loaded
+        assert dict.get(_cmap_database, '_test_lazy') is lazy
+    finally:
+        del _cmap_database['_test_lazy']
+    assert '_test_lazy' not in _cmap_database
+
+
+@pytest.mark.parametrize('name', ['viridis', 'Fire'])
+def test_user_cmap_shadow(tmp_path, monkeypatch, name):
+    """Tests that user files shadow registered colormaps until deleted."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    folder = tmp_path / '.proplot' / 'cmaps'
+    folder.mkdir(parents=True)
+    x = np.linspace(0, 1, 11)
+    cmap = _cmap_database[name]
+    lut = cmap(x)
+    path = folder / (name + '.rgb')
+    path.write_text('1 0 0\n0 0 1\n')
+    try:
+        plot.register_cmaps(default=True)
+        assert np.allclose(_cmap_database[name](0.0), (1, 0, 0, 1))
+        assert np.allclose(_cmap_database[name](1.0), (0, 0, 1, 1))
+    finally:
+        path.unlink()
+        plot.register_cmaps(default=True)
+    assert np.allclose(_cmap_database[name](x), lut)
+    if name == 'viridis':  # matplotlib colormap is restored
+        assert _cmap_database[name] is cmap
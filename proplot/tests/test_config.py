@@ -0,0 +1,49 @@
+import threading
+
+import matplotlib as mpl
+
+import proplot as plot
+
+
+def test_context_restore():
+    """Tests that nested context blocks restore the previous settings."""
+    color = mpl.rcParams['axes.facecolor']
+    loc = plot.rc['title.loc']
+    with plot.rc.context({'axes.facecolor': 'blue', 'title.loc': 'left'}):
+        with plot.rc.context({'axes.facecolor': 'red'}):
+            assert mpl.rcParams['axes.facecolor'] == 'red'
+            assert plot.rc['title.loc'] == 'left'
+        assert mpl.rcParams['axes.facecolor'] == 'blue'
+    assert mpl.rcParams['axes.facecolor'] == color
+    assert plot.rc['title.loc'] == loc
+
+
+def test_context_threads():
+    """Tests context blocks in two threads that exit out of order."""
+    color = mpl.rcParams['axes.facecolor']
+    loc = plot.rc['title.loc']
+    entered1, entered2, exited1 = (threading.Event() for _ in range(3))
+    seen = {}
+
+    def thread1():
+        with plot.rc.context({'axes.facecolor': 'blue', 'title.loc': 'left'}):
+            entered1.set()
+            entered2.wait(5)
+            seen[1] = plot.rc['title.loc']
+        exited1.set()
+
+    def thread2():
+        entered1.wait(5)
+        with plot.rc.context({'axes.facecolor': 'red'}):
+            entered2.set()
+            exited1.wait(5)
+            seen[2] = (mpl.rcParams['axes.facecolor'], plot.rc['title.loc'])
+
+    threads = [threading.Thread(target=thread1), threading.Thread(target=thread2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {1: 'left', 2: ('red', loc)}
+    assert mpl.rcParams['axes.facecolor'] == color
+    assert plot.rc['title.loc'] == loc
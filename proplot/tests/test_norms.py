@@ -0,0 +1,103 @@
+import matplotlib.cm as mcm
+import matplotlib.colors as mcolors
+import numpy as np
+import pytest
+
+import proplot as plot
+from proplot.colors import DiscreteNorm, DivergingNorm, LinearSegmentedNorm
+
+
+def test_discrete_cache_parameters():
+    """Tests that changing normalizer parameters invalidates cached bins."""
+    levels = np.linspace(0, 10, 11)
+    norm = mcolors.PowerNorm(gamma=0.5)
+    dest1 = DiscreteNorm(levels, norm=norm)._dest.copy()
+    norm.gamma = 2
+    dest2 = DiscreteNorm(levels, norm=norm)._dest.copy()
+    dest3 = DiscreteNorm(levels, norm=mcolors.PowerNorm(gamma=2))._dest
+    assert not np.allclose(dest1, dest2)
+    assert np.allclose(dest2, dest3)
+    dest1 = DiscreteNorm(levels, norm=plot.Norm('symlog', 1, base=10))._dest
+    dest2 = DiscreteNorm(levels, norm=plot.Norm('symlog', 5, base=10))._dest
+    assert not np.allclose(dest1, dest2)
+
+
+def test_discrete_cache_arrays():
+    """Tests that cached arrays are read-only and public arrays are copies."""
+    levels = [0, 1, 2, 5, 10]
+    norm1 = DiscreteNorm(levels)
+    assert not norm1._bins.flags.writeable
+    assert not norm1._dest.flags.writeable
+    norm1.boundaries[0] = -1
+    norm2 = DiscreteNorm(levels)
+    assert norm2._bins is norm1._bins
+    assert norm2.boundaries[0] == 0
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+@pytest.mark.parametrize('unique', ['neither', 'min', 'max', 'both'])
+def test_discrete_bins(dtype, unique):
+    """Tests that data values, including edge values, map to the expected bins."""
+    norm = DiscreteNorm([0, 1, 2, 5, 10], unique=unique)
+    data = np.array([-1, 0, 0.5, 1, 1.5, 5, 9.5, 10, 11, np.nan], dtype=dtype)
+    index = [0, 0, 1, 1, 2, 3, 4, 4, 5]  # under, four bins, and over
+    result = norm(data)
+    assert np.allclose(result[:-1], norm._dest[index])
+    assert np.ma.getmaskarray(result).tolist() == [False] * 9 + [True]
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_discrete_clip(dtype):
+    """Tests that clipped values map to the same bins for any dtype."""
+    norm = DiscreteNorm(
+        np.linspace(0.1, 20, 9), mcolors.Normalize(), unique='both', clip=True
+    )
+    data = np.array([0.05, 0.075, 20.05, 25], dtype=dtype)
+    result = norm(data)
+    assert np.allclose(result, norm._dest[[0, 0, -2, -2]])
+
+
+def test_discrete_mappable():
+    """Tests that matplotlib mappables are not modified by proplot."""
+    assert mcm.ScalarMappable.to_rgba.__module__ == mcm.__name__
+
+
+@pytest.mark.parametrize('dtype', ['int64', 'float32', 'float64'])
+def test_segmented_values(dtype):
+    """Tests the output values and dtype of the segmented normalizer."""
+    norm = LinearSegmentedNorm([0, 1, 5, 10])
+    data = np.array([-1, 0, 1, 3, 5, 10, 12], dtype=dtype)
+    expect = [-1 / 3, 0, 1 / 3, 0.5, 2 / 3, 1, 17 / 15]
+    result = norm(data)
+    assert not np.ma.isMaskedArray(result)
+    assert result.dtype == (np.float64 if dtype == 'int64' else dtype)
+    assert np.allclose(result, expect)
+    assert np.allclose(norm(data, clip=True), np.clip(expect, 0, 1))
+    assert np.allclose(norm.inverse(result), data, rtol=1e-6)
+    assert np.isclose(norm(3), 0.5) and np.ndim(norm(3)) == 0
+
+
+def test_segmented_masked():
+    """Tests that masked data stays masked and the output can be the input."""
+    norm = LinearSegmentedNorm([0, 1, 5, 10])
+    data = np.ma.masked_array([0, 1, 3, 5], mask=[0, 0, 1, 0], dtype='float32')
+    result = norm(data)
+    assert np.ma.getmaskarray(result).tolist() == [False, False, True, False]
+    data = np.array([0, 1, 3, 5], dtype='float32')
+    result = norm(data, out=data)
+    assert result is data
+    assert np.allclose(data, [0, 1 / 3, 0.5, 2 / 3])
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+@pytest.mark.parametrize('fair, expect', [
+    (True, [0.125, 0.25, 0.375, 0.5, 0.75, 1, 1.125]),
+    (False, [-0.25, 0, 0.25, 0.5, 0.75, 1, 1.125]),
+])
+def test_diverging_values(dtype, fair, expect):
+    """Tests the output values and dtype of the diverging normalizer."""
+    norm = DivergingNorm(vcenter=0, vmin=-2, vmax=4, fair=fair)
+    data = np.array([-3, -2, -1, 0, 2, 4, 5], dtype=dtype)
+    result = norm(data)
+    assert result.dtype == dtype
+    assert np.allclose(result, expect)
@@ -38,11 +38,13 @@ UNIT_DICT = {
 
 # Shared parameters
 docstring.snippets['param.rgba'] = """
-color : color-spec
-    The color. Sanitized with `to_rgba`.
+color : color-spec or list thereof
+    The color. Sanitized with `to_rgba`. If this is a list of colors or an
+    array of channel values with shape ``(..., 3)`` or ``(..., 4)``, all colors
+    are processed at once and an array of colors is returned.
 """
 docstring.snippets['param.to_rgb'] = """
-color : str, 3-tuple, or 4-tuple
+color : str, 3-tuple, 4-tuple, or list thereof
     The color specification. Can be a tuple of channel values, a hex string,
     a registered color name, a cycle color like ``'C0'``, or a colormap color
     (see `~proplot.colors.ColorDatabase`).
@@ -50,6 +52,10 @@ color : str, 3-tuple, or 4-tuple
     If `space` is ``'rgb'``, this is a tuple of RGB values, and if any
     channels are larger than ``2``, the channels are assumed to be on
     the ``0`` to ``255`` scale and are divided by ``255``.
+
+    This can also be a list of colors or an array of channel values with
+    shape ``(..., 3)`` or ``(..., 4)``. In this case, all colors are translated
+    in one vectorized pass and an array of colors is returned.
 space : {'rgb', 'hsv', 'hcl', 'hpl', 'hsl'}, optional
     The colorspace for the input channel values. Ignored unless `color` is
     a tuple of numbers.
@@ -65,12 +71,14 @@ space : {'hcl', 'hpl', 'hsl', 'hsv'}, optional
 
 # Shared return values
 docstring.snippets['return.rgb'] = """
-color : 3-tuple
-    An RGB tuple.
+color : 3-tuple or ndarray
+    An RGB tuple, or an array with shape ``(..., 3)`` if a list of
+    colors was passed.
 """
 docstring.snippets['return.rgba'] = """
-color : 4-tuple
-    An RGBA tuple.
+color : 4-tuple or ndarray
+    An RGBA tuple, or an array with shape ``(..., 4)`` if a list of
+    colors was passed.
 """
 
 
@@ -192,10 +200,17 @@ def edges2d(Z):
 
 def _transform_color(func, color, space):
     """
-    Standardized input for color transformation functions.
+    Standardized input for color transformation functions. The transform
+    is applied to a channel array with the channels along the last axis.
     """
+    if not _is_single_color(color):
+        rgba = to_rgba(color)
+        channels = _to_xyz_array(rgba[..., :3], space=space)
+        channels = func(channels)  # apply transform
+        rgba[..., :3] = np.clip(_to_rgb_array(channels, space=space), 0, 1)
+        return rgba
     *color, opacity = to_rgba(color)
-    channels = list(to_xyz(color, space=space))
+    channels = np.array(to_xyz(color, space=space))
     channels = func(channels)  # apply transform
     color = to_rgb(channels, space=space)
     color = tuple(np.clip(color, 0, 1))  # clip to valid range
@@ -210,8 +225,9 @@ def scale_saturation(color, scale=1, space='hcl'):
     Parameters
     ----------
     %(param.rgba)s
-    scale : float, optoinal
-        The HCL saturation channel is multiplied by this value.
+    scale : float or array-like, optoinal
+        The HCL saturation channel is multiplied by this value. If a list
+        of colors was passed, this can be an array of values for each color.
     %(param.space)s
 
     Returns
@@ -223,7 +239,7 @@ def scale_saturation(color, scale=1, space='hcl'):
     set_saturation, scale_luminance
     """
     def func(channels):
-        channels[1] *= scale
+        channels[..., 1] *= scale
         return channels
 
     return _transform_color(func, color, space)
@@ -237,8 +253,9 @@ def scale_luminance(color, scale=1, space='hcl'):
     Parameters
     ----------
     %(param.rgba)s
-    scale : float, optoinal
-        The luminance channel is multiplied by this value.
+    scale : float or array-like, optoinal
+        The luminance channel is multiplied by this value. If a list
+        of colors was passed, this can be an array of values for each color.
     %(param.space)s
 
     Returns
@@ -250,7 +267,7 @@ def scale_luminance(color, scale=1, space='hcl'):
     set_luminance, scale_saturation
     """
     def func(channels):
-        channels[2] *= scale
+        channels[..., 2] *= scale
         return channels
 
     return _transform_color(func, color, space)
@@ -264,9 +281,13 @@ def set_alpha(color, alpha):
     Parameters
     ----------
     %(param.rgba)s
-    alpha : float, optional
+    alpha : float or array-like, optional
         The new opacity. Should be between ``0`` and ``1``.
     """
+    if not _is_single_color(color):
+        color = to_rgba(color)
+        color[..., 3] = alpha
+        return color
     color = list(to_rgba(color))
     color[3] = alpha
     return tuple(color)
@@ -281,7 +302,7 @@ def set_hue(color, hue, space='hcl'):
     Parameters
     ----------
     %(param.rgba)s
-    hue : float, optional
+    hue : float or array-like, optional
         The new hue. Should lie between ``0`` and ``360`` degrees.
     %(param.space)s
 
@@ -294,7 +315,7 @@ def set_hue(color, hue, space='hcl'):
     set_saturation, set_luminance
     """
     def func(channels):
-        channels[0] = hue
+        channels[..., 0] = hue
         return channels
 
     return _transform_color(func, color, space)
@@ -309,7 +330,7 @@ def set_saturation(color, saturation, space='hcl'):
     Parameters
     ----------
     %(param.rgba)s
-    saturation : float, optional
+    saturation : float or array-like, optional
         The new saturation. Should lie between ``0`` and ``360`` degrees.
     %(param.space)s
 
@@ -322,7 +343,7 @@ def set_saturation(color, saturation, space='hcl'):
     set_hue, set_luminance, scale_saturation
     """
     def func(channels):
-        channels[1] = saturation
+        channels[..., 1] = saturation
         return channels
 
     return _transform_color(func, color, space)
@@ -337,7 +358,7 @@ def set_luminance(color, luminance, space='hcl'):
     Parameters
     ----------
     %(param.rgba)s
-    luminance : float, optional
+    luminance : float or array-like, optional
         The new luminance. Should lie between ``0`` and ``100``.
     %(param.space)s
 
@@ -350,12 +371,134 @@ def set_luminance(color, luminance, space='hcl'):
     set_hue, set_saturation, scale_luminance
     """
     def func(channels):
-        channels[2] = luminance
+        channels[..., 2] = luminance
         return channels
 
     return _transform_color(func, color, space)
 
 
+def _is_single_color(color):
+    """
+    Return whether the input is a single color rather than a list of colors.
+    Single colors are strings, tuples of channel values, and
+    ``(cmap, index)`` colormap color specifications.
+    """
+    # NOTE: Numeric sequences of any length are single colors so that invalid
+    # channel counts raise the usual error in `to_rgba`.
+    if isinstance(color, str) or not np.iterable(color):
+        return True
+    if all(isinstance(c, Number) for c in color):
+        return True
+    return len(color) == 2 and isinstance(color[1], Number)
+
+
+def _to_rgba_batch(colors, space='rgb', cycle=None):
+    """
+    Translate a list of colors or an array of channel values to an RGBA array.
+    Numeric arrays are translated in one vectorized pass. Other lists are
+    translated once for each unique color.
+    """
+    # Numeric arrays with channels along the last axis
+    # NOTE: Skip lists containing strings since e.g. '0.5' is a valid grayscale.
+    array = None
+    if isinstance(colors, np.ndarray):
+        if colors.dtype.kind in 'biuf':
+            array = colors.astype(float)
+    elif not any(isinstance(color, str) for color in colors):
+        try:
+            array = np.array(colors, dtype=float)
+        except (ValueError, TypeError):
+            pass
+    if array is not None and array.ndim > 1:
+        if array.shape[-1] not in (3, 4):
+            raise ValueError(
+                f'Invalid RGB argument with shape {array.shape}. '
+                'Channels should be along the last axis.'
+            )
+        rgba = np.ones((*array.shape[:-1], 4))
+        rgba[..., :3] = _to_rgb_array(array[..., :3], space=space)
+        if array.shape[-1] == 4:
+            rgba[..., 3] = array[..., 3]
+        return rgba
+
+    # Arbitrary lists of colors
+    # NOTE: Typically these lists are long but have few unique colors.
+    cache = {}
+    rgba = np.empty((len(colors), 4))
+    for i, color in enumerate(colors):
+        if not isinstance(color, str) and not np.iterable(color):
+            raise ValueError(f'Invalid RGB argument {colors!r}.')
+        key = color if isinstance(color, str) else tuple(np.ravel(color).tolist())
+        try:
+            rgba[i, :] = cache[key]
+        except KeyError:
+            rgba[i, :] = cache[key] = to_rgba(color, space=space, cycle=cycle)
+        except TypeError:  # unhashable
+            rgba[i, :] = to_rgba(color, space=space, cycle=cycle)
+    return rgba
+
+
+def _hex_to_rgb_array(colors):
+    """
+    Translate a list of 6-digit hex strings to an RGB array in one pass.
+    Other color specifications are translated with `to_rgb`.
+    """
+    if all(
+        isinstance(color, str) and len(color) == 7 and color[0] == '#'
+        for color in colors
+    ):
+        try:
+            data = bytes.fromhex(''.join(color[1:] for color in colors))
+        except ValueError:
+            pass
+        else:
+            return np.frombuffer(data, dtype=np.uint8).reshape(-1, 3) / 255
+    return np.array([to_rgb(color) for color in colors], dtype=float).reshape(-1, 3)
+
+
+def _to_rgb_array(array, space='rgb'):
+    """
+    Translate an array of channel values with shape ``(..., 3)`` from *any*
+    colorspace to RGB in one vectorized pass. This is the array analogue of
+    the colorspace conversion performed by `to_rgb`.
+    """
+    array = np.asarray(array, dtype=float)
+    if space == 'rgb':
+        scale = np.any(array > 2, axis=-1, keepdims=True)
+        return np.where(scale, array / 255, array)  # scale to within 0-1
+    elif space == 'hsv':
+        return hsluv.hsl_to_rgb_array(array)
+    elif space == 'hcl':
+        return hsluv.hcl_to_rgb_array(array)
+    elif space == 'hsl':
+        return hsluv.hsluv_to_rgb_array(array)
+    elif space == 'hpl':
+        return hsluv.hpluv_to_rgb_array(array)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+
+
+def _to_xyz_array(array, space='hcl'):
+    """
+    Translate an array of RGB values with shape ``(..., 3)`` to *any*
+    colorspace in one vectorized pass. This is the array analogue of
+    the colorspace conversion performed by `to_xyz`.
+    """
+    array = np.asarray(array, dtype=float)
+    if space == 'rgb':
+        return array.copy()
+    elif space == 'hsv':
+        return hsluv.rgb_to_hsl_array(array)
+    elif space == 'hcl':
+        return hsluv.rgb_to_hcl_array(array)
+    elif space == 'hsl':
+        return hsluv.rgb_to_hsluv_array(array)
+    elif space == 'hpl':
+        return hsluv.rgb_to_hpluv_array(array)
+    else:
+        raise ValueError(f'Invalid colorspace {space!r}.')
+
+
 @docstring.add_snippets
 def to_rgb(color, space='rgb', cycle=None):
     """
@@ -375,7 +518,8 @@ def to_rgb(color, space='rgb', cycle=None):
     --------
     to_rgba, to_xyz
     """
-    return to_rgba(color, space=space, cycle=cycle)[:3]
+    rgba = to_rgba(color, space=space, cycle=cycle)
+    return rgba[..., :3] if isinstance(rgba, np.ndarray) else rgba[:3]
 
 
 @docstring.add_snippets
@@ -397,6 +541,10 @@ def to_rgba(color, space='rgb', cycle=None):
     --------
     to_rgb, to_xyza
     """
+    # Convert lists of colors
+    if not _is_single_color(color):
+        return _to_rgba_batch(color, space=space, cycle=cycle)
+
     # Convert color cycle strings
     if isinstance(color, str) and re.match(r'\AC[0-9]\Z', color):
         if isinstance(cycle, str):
@@ -473,14 +621,16 @@ def to_xyz(color, space='hcl'):
 
     Returns
     -------
-    color : 3-tuple
-        Tuple of channel values for the colorspace `space`.
+    color : 3-tuple or ndarray
+        Tuple of channel values for the colorspace `space`, or an array with
+        shape ``(..., 3)`` if a list of colors was passed.
 
     See also
     --------
     to_rgb, to_xyza
     """
-    return to_xyza(color, space)[:3]
+    xyza = to_xyza(color, space)
+    return xyza[..., :3] if isinstance(xyza, np.ndarray) else xyza[:3]
 
 
 @docstring.add_snippets
@@ -497,13 +647,20 @@ def to_xyza(color, space='hcl'):
 
     Returns
     -------
-    color : 3-tuple
-        Tuple of channel values for the colorspace `space`.
+    color : 4-tuple or ndarray
+        Tuple of channel values for the colorspace `space`, or an array with
+        shape ``(..., 4)`` if a list of colors was passed.
 
     See also
     --------
     to_rgba, to_xyz
     """
+    # Convert lists of colors
+    if not _is_single_color(color):
+        rgba = to_rgba(color)
+        rgba[..., :3] = _to_xyz_array(rgba[..., :3], space=space)
+        return rgba
+
     # Run tuple conversions
     # NOTE: Don't pass color tuple, because we may want to permit
     # out-of-bounds RGB values to invert conversion